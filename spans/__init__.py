@@ -29,6 +29,14 @@ __all__ = [
     "daterangeset",
     "datetimerangeset",
     "timedeltarangeset",
+    "frozenintrangeset",
+    "frozenfloatrangeset",
+    "frozenstrrangeset",
+    "frozendaterangeset",
+    "frozendatetimerangeset",
+    "frozentimedeltarangeset",
+    "compactintrangeset",
+    "compactfloatrangeset",
 ]
 
 
@@ -0,0 +1,203 @@
+"""Compact storage for normalized lists of numeric ranges"""
+
+from array import array
+from bisect import bisect_left
+
+from .types import _internal_range
+
+__all__ = [
+    "CompactRangeList",
+]
+
+
+# Bits of the flags stored for every range
+LOWER_INC = 1
+UPPER_INC = 2
+LOWER_INF = 4
+UPPER_INF = 8
+
+# Internal bound information for every possible flags byte, as a tuple of
+# lower_inf, upper_inf, lower_inc and upper_inc
+_decoded_flags = [
+    (
+        bool(flags & LOWER_INF),
+        bool(flags & UPPER_INF),
+        bool(flags & LOWER_INC),
+        bool(flags & UPPER_INC),
+    )
+    for flags in range(16)
+]
+
+
+class CompactRangeList(object):
+    """
+    A list of non-empty ranges stored as parallel arrays from the ``array``
+    module, instead of one Python object per range. The lower and upper bounds
+    are stored in one typed array each, and the inclusiveness of the bounds and
+    whether they are unbounded are stored as bit flags in an array of bytes.
+
+    Ranges are created when they are accessed. This works like a list of ranges
+    as far as range sets are concerned. Indexing, slicing, assigning to slices
+    and iterating are supported. Slicing returns a new compact list.
+
+    The bounds of unbounded ends are stored as zero. The flags store the
+    internal inclusiveness of the range, which makes it possible to recreate
+    the exact same range.
+
+    :param range_type: Type of the stored ranges.
+    :param lower: Array of lower bounds.
+    :param upper: Array of upper bounds, of the same type as `lower`.
+    :param flags: Array of bytes with the flags of every range.
+    """
+
+    __slots__ = ("type", "lower", "upper", "flags")
+
+    def __init__(self, range_type, lower, upper, flags):
+        self.type = range_type
+        self.lower = lower
+        self.upper = upper
+        self.flags = flags
+
+    @classmethod
+    def from_ranges(cls, range_type, typecode, ranges):
+        """
+        Create a new compact list from the given ranges.
+
+        :param range_type: Type of the stored ranges.
+        :param typecode: Type code of the arrays used to store the bounds.
+        :param ranges: Iterable of non-empty ranges to store.
+        :raises OverflowError: If a bound does not fit in the array type.
+        """
+
+        lower = array(typecode)
+        upper = array(typecode)
+        flags = array("B")
+        for r in ranges:
+            lower_value, upper_value, lower_inc, upper_inc, _ = r._range
+            lower_inf = lower_value is None
+            upper_inf = upper_value is None
+
+            lower.append(0 if lower_inf else lower_value)
+            upper.append(0 if upper_inf else upper_value)
+            flags.append(
+                (lower_inc and LOWER_INC)
+                | (upper_inc and UPPER_INC)
+                | (lower_inf and LOWER_INF)
+                | (upper_inf and UPPER_INF)
+            )
+        return cls(range_type, lower, upper, flags)
+
+    def bisect_upper(self, value):
+        """
+        Return the index of the first range that does not end before the given
+        scalar, using binary search over the upper bounds. The ranges must be
+        normalized the same way as the ranges of a range set are.
+        """
+
+        # Only the last range may be unbounded to the right. It never ends
+        # before any scalar
+        hi = len(self)
+        if hi and self.flags[-1] & UPPER_INF:
+            hi -= 1
+
+        i = bisect_left(self.upper, value, 0, hi)
+        if i < hi and self.upper[i] == value and not self.flags[i] & UPPER_INC:
+            i += 1
+        return i
+
+    def _range(self, lower, upper, flags):
+        lower_inf, upper_inf, lower_inc, upper_inc = _decoded_flags[flags]
+        return self.type._from_internal(
+            _internal_range(
+                None if lower_inf else lower,
+                None if upper_inf else upper,
+                lower_inc,
+                upper_inc,
+                False,
+            )
+        )
+
+    def __len__(self):
+        return len(self.flags)
+
+    def __iter__(self):
+        return map(self._range, self.lower, self.upper, self.flags)
+
+    def __reversed__(self):
+        return map(
+            self._range,
+            reversed(self.lower),
+            reversed(self.upper),
+            reversed(self.flags),
+        )
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.__class__(
+                self.type,
+                self.lower[index],
+                self.upper[index],
+                self.flags[index],
+            )
+        return self._range(self.lower[index], self.upper[index], self.flags[index])
+
+    def __setitem__(self, index, ranges):
+        if not isinstance(index, slice):
+            index = slice(index, index + 1 or None)
+            ranges = [ranges]
+
+        if not isinstance(ranges, CompactRangeList):
+            ranges = self.from_ranges(self.type, self.lower.typecode, ranges)
+
+        self.lower[index] = ranges.lower
+        self.upper[index] = ranges.upper
+        self.flags[index] = ranges.flags
+
+    def __delitem__(self, index):
+        del self.lower[index]
+        del self.upper[index]
+        del self.flags[index]
+
+    # Equality is decided by the arrays directly since every range is stored
+    # one way only. Ordering has to compare the ranges themselves
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactRangeList):
+            return NotImplemented
+        return (
+            self.type is other.type
+            and self.flags == other.flags
+            and self.lower == other.lower
+            and self.upper == other.upper
+        )
+
+    def __ne__(self, other):
+        if not isinstance(other, CompactRangeList):
+            return NotImplemented
+        return not self == other
+
+    def __lt__(self, other):
+        if not isinstance(other, CompactRangeList):
+            return NotImplemented
+        return list(self) < list(other)
+
+    def __le__(self, other):
+        if not isinstance(other, CompactRangeList):
+            return NotImplemented
+        return list(self) <= list(other)
+
+    def __gt__(self, other):
+        if not isinstance(other, CompactRangeList):
+            return NotImplemented
+        return list(self) > list(other)
+
+    def __ge__(self, other):
+        if not isinstance(other, CompactRangeList):
+            return NotImplemented
+        return list(self) >= list(other)
+
+    def __reduce__(self):
+        return (self.__class__, (self.type, self.lower, self.upper, self.flags))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
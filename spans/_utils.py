@@ -1,6 +1,6 @@
 """Helper functions"""
 
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 
 __all__ = [
     "date_from_iso_week",
@@ -18,15 +18,15 @@ def date_from_iso_week(year, week, day_of_week=None):
             f"Day of week is not in range 1 through 7, got {day_of_week!r}"
         )
 
-    day = datetime.strptime(f"{year:04d}-{week:02d}-{day_of_week:d}", "%Y-%W-%w")
+    if not 0 <= week <= 53:
+        raise ValueError(f"Week is not in range 0 through 53, got {week!r}")
 
-    # ISO week 1 is defined as the first week to have 4 or more days in January.
-    # Python's built-in date parsing considers the week that contain the first
-    # Monday of the year to be the first week.
-    if date(year, 1, 4).isoweekday() > 4:
-        day -= timedelta(days=7)
+    # ISO week 1 is defined as the first week to have 4 or more days in January,
+    # which means that it's always the week that contains January 4th
+    jan_4 = date(year, 1, 4)
+    first_monday = jan_4 - timedelta(days=jan_4.weekday())
 
-    return day.date()
+    return first_monday + timedelta(weeks=week - 1, days=day_of_week - 1)
 
 
 def find_slots(cls):
@@ -50,40 +50,13 @@ class PicklableSlotMixin(object):
     __slots__ = ()
 
     def __getstate__(self):
-        return {attr: getattr(self, attr) for attr in find_slots(self.__class__)}
+        # Slots that have not been assigned yet are left out
+        return {
+            attr: getattr(self, attr)
+            for attr in find_slots(self.__class__)
+            if hasattr(self, attr)
+        }
 
     def __setstate__(self, data):
         for attr, value in data.items():
             setattr(self, attr, value)
-
-
-class PartialOrderingMixin(object):
-    __slots__ = ()
-
-    def __le__(self, other):
-        lt = self.__lt__(other)
-        eq = self.__eq__(other)
-
-        if lt is NotImplemented and eq is NotImplemented:
-            return NotImplemented
-        return lt is True or eq is True
-
-    def __gt__(self, other):
-        le = self.__le__(other)
-        if le is NotImplemented:
-            return NotImplemented
-        return not le
-
-    def __ge__(self, other):
-        gt = self.__gt__(other)
-        eq = self.__eq__(other)
-        if gt is NotImplemented and eq is NotImplemented:
-            return NotImplemented
-        return gt is True or eq is True
-
-    def __ne__(self, other):
-        eq = self.__eq__(other)
-        if eq is NotImplemented:
-            return NotImplemented
-
-        return not eq
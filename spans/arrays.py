@@ -0,0 +1,909 @@
+"""
+Arrays of ranges backed by NumPy.
+
+NumPy is an optional dependency of Spans. This module can always be imported,
+but range arrays can only be created when NumPy is installed.
+"""
+
+from array import array
+from datetime import date, datetime
+from math import fsum
+
+from ._compact import (
+    LOWER_INC,
+    LOWER_INF,
+    UPPER_INC,
+    UPPER_INF,
+    CompactRangeList,
+)
+from .types import (
+    DiscreteRange,
+    _internal_range,
+    _is_valid_date,
+    daterange,
+    datetimerange,
+    floatrange,
+    intrange,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+__all__ = [
+    "intrangearray",
+    "floatrangearray",
+    "daterangearray",
+    "datetimerangearray",
+]
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required to use range arrays")
+
+
+# The following helpers work like their counterparts in spans.types, but
+# compare every pair of ranges in two range arrays at once. Bound values are
+# undefined for unbounded ends and empty ranges, which is why the results are
+# always masked using the infinity and emptiness columns
+
+
+def _cmp_lower(a, b):
+    cmp = np.where(
+        a.lower < b.lower,
+        -1,
+        np.where(b.lower < a.lower, 1, b.lower_inc.astype(np.int8) - a.lower_inc),
+    )
+    return np.where(
+        a.lower_inf,
+        np.where(b.lower_inf, 0, -1),
+        np.where(b.lower_inf, 1, cmp),
+    )
+
+
+def _cmp_upper(a, b):
+    cmp = np.where(
+        a.upper < b.upper,
+        -1,
+        np.where(b.upper < a.upper, 1, a.upper_inc.astype(np.int8) - b.upper_inc),
+    )
+    return np.where(
+        a.upper_inf,
+        np.where(b.upper_inf, 0, 1),
+        np.where(b.upper_inf, -1, cmp),
+    )
+
+
+def _ends_before_start(a, b):
+    return (
+        ~a.is_empty
+        & ~b.is_empty
+        & ~a.upper_inf
+        & ~b.lower_inf
+        & ((a.upper < b.lower) | ((a.upper == b.lower) & ~(a.upper_inc & b.lower_inc)))
+    )
+
+
+def _touches(a, b):
+    return (
+        ~a.is_empty
+        & ~b.is_empty
+        & ~a.upper_inf
+        & ~b.lower_inf
+        & (a.upper == b.lower)
+        & (a.upper_inc != b.lower_inc)
+    )
+
+
+def _within(lower, upper, lower_inc, upper_inc, lower_inf, upper_inf, values, exact):
+    # Test which values are within the given bounds. Values that are not exact
+    # lie strictly between their value and the next one, which means that they
+    # are greater than a lower bound equal to their value, and less than an
+    # equal upper bound
+    if exact is None:
+        exact = np.True_
+
+    at_lower = (lower == values) & (lower_inc | ~exact)
+    at_upper = (upper == values) & upper_inc & exact
+    within_lower = lower_inf | (lower < values) | at_lower
+    within_upper = upper_inf | (values < upper) | at_upper
+    return within_lower & within_upper
+
+
+class RangeArray(object):
+    """
+    Abstract base class of all range arrays. A range array stores many ranges
+    of the same type as parallel NumPy arrays, called columns, instead of one
+    Python object per range. This makes it possible to test and combine a large
+    number of ranges at once.
+
+    .. code-block:: python
+
+        ranges = intrangearray([intrange(1, 5), intrange(10), intrange.empty()])
+        ranges.contains(3)  # array([ True, False, False])
+        ranges.overlap(intrange(4, 12))  # array([ True,  True, False])
+
+    The operations work the same way as the methods with the same names on
+    :class:`~spans.types.Range`, but return arrays with one element per range.
+    The argument may be a single range, which is then compared against every
+    range in the array, or another range array of the same length, which is
+    compared element wise.
+
+    The columns are available as attributes:
+
+    - ``lower`` and ``upper`` contain the bounds. Their values are undefined
+      for unbounded ends and empty ranges.
+    - ``lower_inc`` and ``upper_inc`` are ``True`` for inclusive bounds.
+    - ``lower_inf`` and ``upper_inf`` are ``True`` for unbounded ends.
+    - ``is_empty`` is ``True`` for empty ranges.
+
+    :param ranges: Iterable of ranges to store in this array.
+    :raises ImportError: If NumPy is not installed.
+    :raises TypeError: If any range is of the wrong type.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = (
+        "lower",
+        "upper",
+        "lower_inc",
+        "upper_inc",
+        "lower_inf",
+        "upper_inf",
+        "is_empty",
+    )
+
+    #: The range type stored in this array
+    type = None
+
+    #: The NumPy data type used for the bounds
+    dtype = None
+
+    # Value used in place of None for unbounded ends and empty ranges
+    _fill = None
+
+    # Kinds of NumPy arrays that can be converted to bounds
+    _kinds = ""
+
+    # Greatest bound of discrete range types that has a next value
+    _max = None
+
+    def __init__(self, ranges=()):
+        _require_numpy()
+
+        fill = self._fill
+        lower, upper, lower_inc, upper_inc = [], [], [], []
+        lower_inf, upper_inf, is_empty = [], [], []
+        for r in ranges:
+            if not isinstance(r, self.type):
+                raise TypeError(
+                    f"Invalid range type {r.__class__.__name__!r}"
+                    f" expected {self.type.__name__!r}"
+                )
+
+            r = r._range
+            lower.append(fill if r.lower is None else r.lower)
+            upper.append(fill if r.upper is None else r.upper)
+            lower_inc.append(r.lower_inc and r.lower is not None)
+            upper_inc.append(r.upper_inc and r.upper is not None)
+            lower_inf.append(r.lower is None and not r.empty)
+            upper_inf.append(r.upper is None and not r.empty)
+            is_empty.append(r.empty)
+
+        self._set_columns(
+            self._convert(lower),
+            self._convert(upper),
+            np.array(lower_inc, dtype=bool),
+            np.array(upper_inc, dtype=bool),
+            np.array(lower_inf, dtype=bool),
+            np.array(upper_inf, dtype=bool),
+            np.array(is_empty, dtype=bool),
+        )
+
+    @classmethod
+    def from_arrays(cls, lower, upper, lower_inc=None, upper_inc=None):
+        """
+        Create a range array from a sequence of lower bounds and a sequence of
+        upper bounds. The bounds may be given as NumPy arrays or as any other
+        sequence. Unbounded ends are given as ``None``, or ``NaT`` for arrays
+        of ``datetime64``.
+
+        .. code-block:: python
+
+            intrangearray.from_arrays([1, 5, None], [3, None, 10])
+            # intrangearray([intrange(1, 3), intrange(5), intrange(upper=10)])
+
+        Bounds are validated and normalized the same way the range constructor
+        does it, but for all ranges at once.
+
+        :param lower: Lower bounds.
+        :param upper: Upper bounds.
+        :param lower_inc: ``True`` if the lower bounds are included. May be a
+                          single value or one value per range. By default
+                          bounded lower bounds are included.
+        :param upper_inc: ``True`` if the upper bounds are included. May be a
+                          single value or one value per range. By default upper
+                          bounds are not included.
+        :return: A new range array.
+        :raises ImportError: If NumPy is not installed.
+        :raises TypeError: If any bound is of the wrong type.
+        :raises ValueError: If any upper bound is less than its lower bound, or
+                            if an unbounded end is inclusive.
+        """
+
+        _require_numpy()
+
+        lower, lower_inf = cls._bounds(lower)
+        upper, upper_inf = cls._bounds(upper)
+        if lower.shape != upper.shape:
+            raise ValueError("Lower and upper bounds must be of the same length")
+
+        lower_inc = cls._flags(lower_inc, ~lower_inf)
+        upper_inc = cls._flags(upper_inc, np.zeros(upper.shape, dtype=bool))
+
+        bounded = ~lower_inf & ~upper_inf
+        if (bounded & (upper < lower)).any():
+            raise ValueError("Upper bound is less than lower bound")
+
+        if (lower_inf & lower_inc).any():
+            raise ValueError("Lower bound can not be inclusive when infinite")
+
+        if (upper_inf & upper_inc).any():
+            raise ValueError("Upper bound can not be inclusive when infinite")
+
+        if issubclass(cls.type, DiscreteRange):
+            # Discrete ranges are normalized to include the lower bound and
+            # exclude the upper bound. Adding one works for both integers and
+            # days, as long as the bound has a next value
+            next_lower = ~lower_inc & ~lower_inf
+            next_upper = upper_inc & ~upper_inf
+            maximum = np.array(cls._max, dtype=cls.dtype)
+            if (next_lower & (lower >= maximum)).any() or (
+                next_upper & (upper >= maximum)
+            ).any():
+                raise OverflowError("Bound has no next value")
+
+            lower = np.where(next_lower, lower + 1, lower)
+            upper = np.where(next_upper, upper + 1, upper)
+            lower_inc = ~lower_inf
+            upper_inc = np.zeros(upper.shape, dtype=bool)
+            is_empty = bounded & (lower >= upper)
+        else:
+            is_empty = bounded & (lower == upper) & ~(lower_inc & upper_inc)
+
+        return cls._from_columns(
+            lower, upper, lower_inc, upper_inc, lower_inf, upper_inf, is_empty
+        )
+
+    @staticmethod
+    def _flags(flags, default):
+        # Convert the inclusiveness of bounds into a column. None means the
+        # same as for the range constructor, both for all ranges at once and
+        # for single ranges
+        if flags is None:
+            return default
+
+        flags = np.broadcast_to(np.asarray(flags), default.shape)
+        if flags.dtype.kind == "O":
+            return np.where(np.equal(flags, None), default, flags).astype(bool)
+        return flags.astype(bool)
+
+    @classmethod
+    def _bounds(cls, values):
+        # Convert a sequence of bounds into a column and a mask of the unbounded
+        # ends
+        if isinstance(values, np.ndarray) and values.dtype.kind != "O":
+            values = cls._cast_bounds(values)
+            if values.dtype.kind == "M":
+                return values, np.isnat(values)
+            return values, np.zeros(values.shape, dtype=bool)
+
+        values = list(values)
+        fill = cls._fill
+        column = []
+        for value in values:
+            if value is None:
+                column.append(fill)
+            elif cls._is_valid_scalar(value):
+                column.append(value)
+            else:
+                raise TypeError(
+                    f"Invalid type for bound {value.__class__.__name__!r}"
+                    f" expected {cls.type.type.__name__!r}"
+                )
+        return (
+            cls._convert(column),
+            np.array([value is None for value in values], dtype=bool),
+        )
+
+    @classmethod
+    def _from_columns(
+        cls, lower, upper, lower_inc, upper_inc, lower_inf, upper_inf, is_empty
+    ):
+        # Create a range array directly from columns. Bounds and flags of
+        # unbounded ends and empty ranges are reset, to keep the columns
+        # consistent no matter how they were computed
+        self = cls.__new__(cls)
+
+        lower_unset = lower_inf | is_empty
+        upper_unset = upper_inf | is_empty
+        fill = cls._convert([cls._fill])[0]
+        self._set_columns(
+            np.where(lower_unset, fill, lower),
+            np.where(upper_unset, fill, upper),
+            lower_inc & ~lower_unset,
+            upper_inc & ~upper_unset,
+            lower_inf & ~is_empty,
+            upper_inf & ~is_empty,
+            is_empty,
+        )
+        return self
+
+    def _set_columns(
+        self, lower, upper, lower_inc, upper_inc, lower_inf, upper_inf, is_empty
+    ):
+        self.lower = lower
+        self.upper = upper
+        self.lower_inc = lower_inc
+        self.upper_inc = upper_inc
+        self.lower_inf = lower_inf
+        self.upper_inf = upper_inf
+        self.is_empty = is_empty
+
+    def _columns(self):
+        return (
+            self.lower,
+            self.upper,
+            self.lower_inc,
+            self.upper_inc,
+            self.lower_inf,
+            self.upper_inf,
+            self.is_empty,
+        )
+
+    @classmethod
+    def _convert(cls, values):
+        # Convert a list of bound values into a column
+        return np.array(values, dtype=cls.dtype)
+
+    @classmethod
+    def _cast(cls, values):
+        # Cast a NumPy array to the data type of the bounds. Only arrays of the
+        # same kind that can be cast without losing information are accepted
+        dtype = np.dtype(cls.dtype)
+        if values.dtype.kind not in cls._kinds or not np.can_cast(values.dtype, dtype):
+            raise TypeError(
+                f"Unsupported array type {values.dtype.name!r}"
+                f" expected {dtype.name!r}"
+            )
+        return values.astype(dtype, copy=False)
+
+    @classmethod
+    def _cast_bounds(cls, values):
+        # Cast a NumPy array of bounds to the data type of the bounds. Unlike
+        # _cast, arrays that can lose information are accepted as long as
+        # the values themselves can be converted exactly. This allows columns
+        # of datetime64[ns] and uint64 for instance
+        if values.dtype.kind not in cls._kinds or np.can_cast(values.dtype, cls.dtype):
+            return cls._cast(values)
+
+        converted = values.astype(cls.dtype)
+        if values.dtype.kind == "M":
+            lossy = (converted != values) & ~np.isnat(values)
+            if lossy.any():
+                raise ValueError(
+                    f"Bounds can't be converted from {values.dtype.name!r} to"
+                    f" {np.dtype(cls.dtype).name!r} without losing precision"
+                )
+        elif (converted != values).any():
+            raise OverflowError(f"Bounds don't fit in {np.dtype(cls.dtype).name!r}")
+        return converted
+
+    @classmethod
+    def _is_valid_scalar(cls, obj):
+        return cls.type.is_valid_scalar(obj)
+
+    def _scalars(self, values):
+        # Convert a scalar, a sequence of scalars or a NumPy array into an array
+        # that can be compared against the bound columns. Also returns which
+        # values are exact, see _cast_scalars
+        if isinstance(values, (np.ndarray, np.generic)):
+            return self._cast_scalars(np.asarray(values))
+        elif self._is_valid_scalar(values):
+            return self._convert(values), None
+
+        values = list(values)
+        for value in values:
+            if not self._is_valid_scalar(value):
+                raise TypeError(
+                    f"Unsupported type to test for inclusion"
+                    f" {value.__class__.__name__!r}"
+                )
+        return self._convert(values), None
+
+    @classmethod
+    def _cast_scalars(cls, values):
+        # Cast a NumPy array of scalars to compare against the bound columns.
+        # Subclasses may accept arrays that can't be cast without loss. They
+        # then return a boolean array that is False for every value that lies
+        # strictly between the cast value and the next one. None means that
+        # every value is exact
+        return cls._cast(values), None
+
+    def _coerce(self, other):
+        # Turn the argument of a range operation into a range array. Single
+        # ranges become range arrays of length one, which NumPy broadcasts
+        # against every range in this array
+        if isinstance(other, RangeArray):
+            if other.type is not self.type:
+                raise TypeError(
+                    f"Unsupported range array type {other.__class__.__name__!r}"
+                )
+            return other
+        elif isinstance(other, self.type):
+            return self.__class__([other])
+        raise TypeError(f"Unsupported range type {other.__class__.__name__!r}")
+
+    def __len__(self):
+        return len(self.is_empty)
+
+    def __iter__(self):
+        range_type = self.type
+        empty = range_type.empty()
+
+        # Unbounded lower bounds of discrete ranges are stored as inclusive
+        # internally
+        discrete = issubclass(range_type, DiscreteRange)
+
+        for lower, upper, lower_inc, upper_inc, lower_inf, upper_inf, is_empty in zip(
+            *(column.tolist() for column in self._columns())
+        ):
+            if is_empty:
+                yield empty
+                continue
+
+            yield range_type._from_internal(
+                _internal_range(
+                    None if lower_inf else lower,
+                    None if upper_inf else upper,
+                    lower_inc or (discrete and lower_inf),
+                    upper_inc,
+                    False,
+                )
+            )
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if not -len(self) <= index < len(self):
+                raise IndexError("range array index out of range")
+
+            # Select a single element array to reuse the conversion done when
+            # iterating
+            return next(iter(self[index : index + 1 or None]))
+        return self._from_columns(*(column[index] for column in self._columns()))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def contains(self, other):
+        """
+        Test which ranges in this array contain `other`. `other` may be a range,
+        a range array, a scalar or a sequence of scalars. A NumPy array of
+        scalars is accepted as well.
+
+        Unlike :meth:`~spans.types.Range.contains`, empty ranges contain no
+        scalars instead of raising an error.
+
+        :param other: Ranges or scalars to test.
+        :return: A boolean NumPy array with one element per range.
+        :raises TypeError: If `other` is of the wrong type.
+        """
+
+        if isinstance(other, (RangeArray, self.type)):
+            other = self._coerce(other)
+            return np.where(
+                self.is_empty | other.is_empty,
+                other.is_empty,
+                (_cmp_lower(self, other) <= 0) & (_cmp_upper(self, other) >= 0),
+            )
+
+        values, exact = self._scalars(other)
+        return ~self.is_empty & _within(
+            self.lower,
+            self.upper,
+            self.lower_inc,
+            self.upper_inc,
+            self.lower_inf,
+            self.upper_inf,
+            values,
+            exact,
+        )
+
+    def overlap(self, other):
+        """
+        Test which ranges in this array share any points with `other`.
+
+        :param other: Range or range array to test against.
+        :return: A boolean NumPy array with one element per range.
+        :raises TypeError: If `other` is of the wrong type.
+        """
+
+        other = self._coerce(other)
+        return (
+            ~self.is_empty
+            & ~other.is_empty
+            & ~_ends_before_start(self, other)
+            & ~_ends_before_start(other, self)
+        )
+
+    def adjacent(self, other):
+        """
+        Test which ranges in this array are adjacent to `other`.
+
+        :param other: Range or range array to test against.
+        :return: A boolean NumPy array with one element per range.
+        :raises TypeError: If `other` is of the wrong type.
+        """
+
+        other = self._coerce(other)
+        return _touches(self, other) | _touches(other, self)
+
+    def left_of(self, other):
+        """
+        Test which ranges in this array are strictly left of `other`.
+
+        :param other: Range or range array to test against.
+        :return: A boolean NumPy array with one element per range.
+        :raises TypeError: If `other` is of the wrong type.
+        """
+
+        return _ends_before_start(self, self._coerce(other))
+
+    def right_of(self, other):
+        """
+        Test which ranges in this array are strictly right of `other`.
+
+        :param other: Range or range array to test against.
+        :return: A boolean NumPy array with one element per range.
+        :raises TypeError: If `other` is of the wrong type.
+        """
+
+        return _ends_before_start(self._coerce(other), self)
+
+    def union(self, other):
+        """
+        Merge every range in this array with `other`.
+
+        :param other: Range or range array to merge with.
+        :return: A new range array of unions.
+        :raises TypeError: If `other` is of the wrong type.
+        :raises ValueError: If any pair of ranges is neither adjacent nor
+                            overlapping.
+        """
+
+        other = self._coerce(other)
+
+        mergeable = (
+            self.is_empty | other.is_empty | self.overlap(other) | self.adjacent(other)
+        )
+        if not mergeable.all():
+            raise ValueError("Ranges must be either adjacent or overlapping")
+
+        # The result of merging with an empty range is the other range
+        take_lower = np.where(
+            self.is_empty,
+            False,
+            np.where(other.is_empty, True, _cmp_lower(self, other) <= 0),
+        )
+        take_upper = np.where(
+            self.is_empty,
+            False,
+            np.where(other.is_empty, True, _cmp_upper(self, other) >= 0),
+        )
+        return self._combine(
+            other, take_lower, take_upper, self.is_empty & other.is_empty
+        )
+
+    def intersection(self, other):
+        """
+        Intersect every range in this array with `other`.
+
+        :param other: Range or range array to intersect with.
+        :return: A new range array of intersections. Ranges that don't overlap
+                 result in empty ranges.
+        :raises TypeError: If `other` is of the wrong type.
+        """
+
+        other = self._coerce(other)
+        return self._combine(
+            other,
+            _cmp_lower(self, other) >= 0,
+            _cmp_upper(self, other) <= 0,
+            ~self.overlap(other),
+        )
+
+    def _combine(self, other, take_lower, take_upper, is_empty):
+        # Build a range array with the lower bound taken from this array where
+        # take_lower is True and from other otherwise. The same goes for the
+        # upper bound and take_upper
+        return self._from_columns(
+            np.where(take_lower, self.lower, other.lower),
+            np.where(take_upper, self.upper, other.upper),
+            np.where(take_lower, self.lower_inc, other.lower_inc),
+            np.where(take_upper, self.upper_inc, other.upper_inc),
+            np.where(take_lower, self.lower_inf, other.lower_inf),
+            np.where(take_upper, self.upper_inf, other.upper_inf),
+            is_empty,
+        )
+
+
+class intrangearray(RangeArray):
+    """
+    Range array that operates on :class:`~spans.types.intrange`. Bounds are
+    stored as 64 bit integers.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = intrange
+    dtype = "int64"
+    _fill = 0
+    _kinds = "iu"
+    _max = 2**63 - 1
+
+    @classmethod
+    def _cast_scalars(cls, values):
+        if values.dtype.kind == "u" and not np.can_cast(values.dtype, cls.dtype):
+            # Normalized integer ranges never include the greatest 64 bit
+            # integer as their upper bound. Unsigned values greater than it are
+            # therefore contained in exactly the same ranges as it is
+            maximum = np.iinfo(cls.dtype).max
+            return np.minimum(values, maximum).astype(cls.dtype), None
+        return super(intrangearray, cls)._cast_scalars(values)
+
+
+class floatrangearray(RangeArray):
+    """
+    Range array that operates on :class:`~spans.types.floatrange`. Bounds are
+    stored as 64 bit floats.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = floatrange
+    dtype = "float64"
+    _fill = 0.0
+    _kinds = "f"
+
+
+class daterangearray(RangeArray):
+    """
+    Range array that operates on :class:`~spans.types.daterange`. Bounds are
+    stored as ``datetime64[D]``.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = daterange
+    dtype = "datetime64[D]"
+    _fill = date(1970, 1, 1)
+    _kinds = "M"
+    _max = date.max
+
+    @classmethod
+    def _is_valid_scalar(cls, obj):
+        # Datetimes are dates too, but comparing them against dates is not
+        # supported
+        return _is_valid_date(obj, accept_none=False)
+
+
+class datetimerangearray(RangeArray):
+    """
+    Range array that operates on :class:`~spans.types.datetimerange`. Bounds
+    are stored as ``datetime64[us]``, which means that timezone aware datetimes
+    are not supported.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = datetimerange
+    dtype = "datetime64[us]"
+    _fill = datetime(1970, 1, 1)
+    _kinds = "M"
+
+    @classmethod
+    def _convert(cls, values):
+        if isinstance(values, datetime):
+            values = [values]
+            scalar = True
+        else:
+            scalar = False
+
+        if any(value.tzinfo is not None for value in values):
+            raise ValueError("Range arrays do not support timezone aware datetimes")
+
+        column = np.array(values, dtype=cls.dtype)
+        return column[0] if scalar else column
+
+    @classmethod
+    def _cast_scalars(cls, values):
+        if values.dtype.kind == "M" and not np.can_cast(values.dtype, cls.dtype):
+            # Values with a finer unit than microseconds, like the nanoseconds
+            # used by pandas, are rounded down and compared together with
+            # whether they were exact. This gives the same result as comparing
+            # in the finer unit, without converting the bounds to a unit that
+            # may not be able to hold them
+            rounded = values.astype(cls.dtype)
+            return rounded, rounded == values
+        return super(datetimerangearray, cls)._cast_scalars(values)
+
+
+# Range array types by the range type they store
+_range_array_types = {
+    array_type.type: array_type
+    for array_type in [
+        intrangearray,
+        floatrangearray,
+        daterangearray,
+        datetimerangearray,
+    ]
+}
+
+
+def _sorted_contains(ranges, values):
+    """
+    Return a boolean array telling which of the given scalars are within any
+    range of the given range array. The ranges must be normalized the same
+    way as the ranges of a range set are.
+
+    Since the ranges never overlap or touch, the last range that starts at or
+    before a value is the only one that can contain it. These ranges are found
+    using a single binary search over the lower bounds for all values.
+    """
+
+    values, exact = ranges._scalars(values)
+    if not len(ranges):
+        return np.zeros(values.shape, dtype=bool)
+
+    # Only the first range can be unbounded to the left. Its lower bound is
+    # left out of the search since it's smaller than every value
+    start = 1 if ranges.lower_inf[0] else 0
+    i = np.searchsorted(ranges.lower[start:], values, side="right") - 1 + start
+    found = i >= 0
+    i = np.maximum(i, 0)
+
+    return found & _within(
+        ranges.lower[i],
+        ranges.upper[i],
+        ranges.lower_inc[i],
+        ranges.upper_inc[i],
+        ranges.lower_inf[i],
+        ranges.upper_inf[i],
+        values,
+        exact,
+    )
+
+
+def _coalesce(ranges):
+    """
+    Return a range array where the ranges of the given range array are sorted
+    and merged the same way as the ranges of a range set are. Empty ranges are
+    removed.
+
+    This works like :func:`spans.settypes._coalesce`. The ranges are sorted by
+    lower bound, and every range is compared against the range with the
+    greatest upper bound among the ranges before it. A new range starts
+    wherever there is a gap between the two.
+    """
+
+    ranges = ranges[~ranges.is_empty]
+    if not len(ranges):
+        return ranges
+
+    # Sort by lower bound. NumPy sorts by the last key first. Unbounded lower
+    # bounds come first and inclusive bounds come before exclusive ones
+    order = np.lexsort((~ranges.lower_inc, ranges.lower, ~ranges.lower_inf))
+    ranges = ranges[order]
+
+    # The upper bounds are ranked to find the greatest upper bound so far using
+    # a running maximum
+    by_upper = np.lexsort((ranges.upper_inc, ranges.upper, ranges.upper_inf))
+    rank = np.empty(len(ranges), dtype=np.intp)
+    rank[by_upper] = np.arange(len(ranges))
+    last = by_upper[np.maximum.accumulate(rank)]
+
+    previous = ranges[last[:-1]]
+    current = ranges[1:]
+    gap = _ends_before_start(previous, current) & ~_touches(previous, current)
+
+    first = np.concatenate(([0], np.flatnonzero(gap) + 1))
+    last = last[np.concatenate((first[1:] - 1, [len(ranges) - 1]))]
+    return ranges[first]._combine(
+        ranges[last],
+        np.ones(len(first), dtype=bool),
+        np.zeros(len(first), dtype=bool),
+        np.zeros(len(first), dtype=bool),
+    )
+
+
+def _sorted_measure(ranges):
+    """
+    Return the total length of the ranges in the given range array. The ranges
+    must be bounded and normalized the same way as the ranges of a range set
+    are. The result is of the same type as the difference between two bounds.
+
+    Float lengths are summed using :func:`math.fsum` to get the same result no
+    matter how the ranges are stored.
+    """
+
+    if np.issubdtype(ranges.lower.dtype, np.integer):
+        # The lengths of a single range may not fit in a signed 64 bit integer
+        # but the total always fits in an unsigned one, since the ranges don't
+        # overlap. Wrapping arithmetic gives the right result
+        lengths = ranges.upper.view(np.uint64) - ranges.lower.view(np.uint64)
+        return int(lengths.sum(dtype=np.uint64))
+    elif np.issubdtype(ranges.lower.dtype, np.floating):
+        return fsum((ranges.upper - ranges.lower).tolist())
+    return (ranges.upper - ranges.lower).sum().item()
+
+
+def _from_compact(array_type, ranges):
+    """
+    Return a range array with the ranges of the given
+    :class:`~spans._compact.CompactRangeList`. The bounds are copied from the
+    arrays directly, without creating any ranges.
+    """
+
+    # The arrays are copied since the array module does not allow resizing
+    # arrays while they are shared with NumPy
+    lower = np.frombuffer(ranges.lower, dtype=array_type.dtype).copy()
+    upper = np.frombuffer(ranges.upper, dtype=array_type.dtype).copy()
+    flags = np.frombuffer(ranges.flags, dtype=np.uint8)
+
+    return array_type._from_columns(
+        lower,
+        upper,
+        (flags & LOWER_INC) != 0,
+        (flags & UPPER_INC) != 0,
+        (flags & LOWER_INF) != 0,
+        (flags & UPPER_INF) != 0,
+        np.zeros(len(flags), dtype=bool),
+    )
+
+
+def _to_compact(ranges, typecode):
+    """
+    Return a :class:`~spans._compact.CompactRangeList` with the ranges of the
+    given range array, which must not contain any empty ranges. The bounds are
+    copied from the columns directly, without creating any ranges.
+    """
+
+    # Unbounded lower bounds of discrete ranges are stored as inclusive
+    # internally
+    lower_inc = ranges.lower_inc
+    if issubclass(ranges.type, DiscreteRange):
+        lower_inc = lower_inc | ranges.lower_inf
+
+    flags = (
+        lower_inc * np.uint8(LOWER_INC)
+        | ranges.upper_inc * np.uint8(UPPER_INC)
+        | ranges.lower_inf * np.uint8(LOWER_INF)
+        | ranges.upper_inf * np.uint8(UPPER_INF)
+    )
+    return CompactRangeList(
+        ranges.type,
+        array(typecode, ranges.lower.tobytes()),
+        array(typecode, ranges.upper.tobytes()),
+        array("B", flags.astype(np.uint8).tobytes()),
+    )
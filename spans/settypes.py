@@ -1,10 +1,26 @@
+import heapq
+import math
+
 # Imports needed for doctests in date range sets
 from datetime import *
-from itertools import chain
-
-from ._utils import PartialOrderingMixin
+from itertools import chain, islice
+
+from ._compact import CompactRangeList
+from .arrays import _coalesce as _coalesce_array
+from .arrays import (
+    _from_compact,
+    _range_array_types,
+    _sorted_contains,
+    _sorted_measure,
+    _to_compact,
+)
 from .types import *
-from .types import DiscreteRange, OffsetableRangeMixin, Range
+from .types import DiscreteRange, OffsetableRangeMixin, Range, _internal_range
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 __all__ = [
     "intrangeset",
@@ -13,9 +29,236 @@ __all__ = [
     "daterangeset",
     "datetimerangeset",
     "timedeltarangeset",
+    "frozenintrangeset",
+    "frozenfloatrangeset",
+    "frozenstrrangeset",
+    "frozendaterangeset",
+    "frozendatetimerangeset",
+    "frozentimedeltarangeset",
+    "compactintrangeset",
+    "compactfloatrangeset",
 ]
 
 
+def _partition_point(ranges, predicate, lo=0):
+    """
+    Return the index of the first range in the given sorted list for which
+    predicate is false, using binary search. The predicate must be true for
+    every range before that index and false for every range after it.
+    """
+
+    hi = len(ranges)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if predicate(ranges[mid]):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _coalesce(ranges):
+    """
+    Merge the given ranges, sorted by lower bound, into a normalized list of
+    ranges, where no ranges overlap or are adjacent, in a single pass.
+    """
+
+    output = []
+    first = last = None
+    for r in ranges:
+        if first is None:
+            first = last = r
+        elif last.left_of(r) and not last.adjacent(r):
+            output.append(_span(first, last))
+            first = last = r
+        elif not r.endsbefore(last):
+            last = r
+
+    if first is not None:
+        output.append(_span(first, last))
+    return output
+
+
+def _union_all(lists):
+    """
+    Return a normalized list of ranges that are part of any of the given
+    normalized lists of ranges.
+    """
+
+    return _coalesce(heapq.merge(*lists, key=Range.sort_key))
+
+
+def _intersect(a, b):
+    """
+    Return a normalized list of ranges that are part of both the given
+    normalized lists of ranges.
+    """
+
+    output = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        x = a[i]
+        y = b[j]
+        if x.overlap(y):
+            output.append(x.intersection(y))
+
+        # The range that ends first can't overlap any more ranges in the other
+        # list
+        if x.endsbefore(y):
+            i += 1
+        else:
+            j += 1
+    return output
+
+
+def _intersect_all(lists):
+    """
+    Return a normalized list of ranges that are part of every given normalized
+    list of ranges.
+
+    This works like :func:`_intersect`, but keeps the current range of every
+    list in a heap ordered by upper bound to find the range that ends first. The
+    upper bound is taken from the last three items of the sort key.
+    """
+
+    iterators = [iter(ranges) for ranges in lists]
+    heap = []
+    start = None
+    for i, iterator in enumerate(iterators):
+        r = next(iterator, None)
+        if r is None:
+            return []
+
+        heap.append((r.sort_key()[3:], i, r))
+        if start is None or r.startsafter(start):
+            start = r
+    heapq.heapify(heap)
+
+    output = []
+    while True:
+        # Every current range starts before start and ends after first, which
+        # means that the overlap between them is part of all lists
+        _, i, first = heap[0]
+        if start.overlap(first):
+            output.append(start.intersection(first))
+
+        r = next(iterators[i], None)
+        if r is None:
+            return output
+
+        heapq.heapreplace(heap, (r.sort_key()[3:], i, r))
+        if r.startsafter(start):
+            start = r
+
+
+def _subtract(a, b):
+    """
+    Return a normalized list of ranges that are part of the normalized list of
+    ranges a, but not of the normalized list of ranges b.
+    """
+
+    output = []
+    j = 0
+    for x in a:
+        # Skip all ranges that are completely before the current range
+        while j < len(b) and b[j].left_of(x):
+            j += 1
+
+        # Cut away every range that overlaps the current range, from left to
+        # right. The pieces that are left are never empty since x starts before
+        # y when cutting to the left of y, and x ends after y when cutting to the
+        # right of it
+        while j < len(b) and b[j].overlap(x):
+            y = b[j]
+            if not x.startsafter(y):
+                output.append(x._replace_upper(y.lower, not y.lower_inc))
+
+            if x.endsbefore(y):
+                # The rest of the range is removed. Since y may overlap the
+                # next range as well we must not skip past it
+                x = None
+                break
+
+            x = x._replace_lower(y.upper, not y.upper_inc)
+            j += 1
+
+        if x is not None:
+            output.append(x)
+    return output
+
+
+def _complement(ranges, range_type):
+    """
+    Return a normalized list of ranges of the given type, that covers the gaps
+    between the given normalized list of ranges.
+    """
+
+    if not ranges:
+        return [range_type()]
+
+    output = []
+    first = ranges[0]
+    if not first.lower_inf:
+        output.append(range_type(upper=first.lower, upper_inc=not first.lower_inc))
+
+    # The remaining gaps are built directly from the internal ranges, which are
+    # already normalized. Inclusiveness is flipped since the gaps never share
+    # any points with the ranges that surround them
+
+    for a, b in zip(ranges, islice(ranges, 1, None)):
+        output.append(
+            range_type._from_internal(
+                _internal_range(
+                    a._range.upper,
+                    b._range.lower,
+                    not a._range.upper_inc,
+                    not b._range.lower_inc,
+                    False,
+                )
+            )
+        )
+
+    last = ranges[-1]
+    if not last.upper_inf:
+        output.append(
+            range_type._from_internal(
+                _internal_range(
+                    last._range.upper,
+                    None,
+                    not last._range.upper_inc,
+                    False,
+                    False,
+                )
+            )
+        )
+    return output
+
+
+def _measure(ranges, zero):
+    """
+    Return the total length of the given ranges. The ranges must be bounded and
+    normalized. `zero` is the length of an empty set, which also decides how
+    the lengths are added together.
+    """
+
+    lengths = (r._range.upper - r._range.lower for r in ranges)
+    if isinstance(zero, float):
+        # Using fsum makes the result independent of the order of the ranges and
+        # of the vectorized implementation
+        return math.fsum(lengths)
+    return sum(lengths, zero)
+
+
+def _span(first, last):
+    """
+    Return a range from the lower bound of first to the upper bound of last.
+    """
+
+    if first is last:
+        return first
+    return first._replace_upper(last._range.upper, last._range.upper_inc)
+
+
 class MetaRangeSet(type):
     """
     A meta class for RangeSets. The purpose is to automatically add relevant
@@ -90,9 +333,12 @@ class DiscreteRangeSetMixin(object):
             >>> list(intrangeset([intrange(1, 5), intrange(10, 15)]).values())
             [1, 2, 3, 4, 10, 11, 12, 13, 14]
 
+        The ranges are iterated over one by one, without unpacking the whole set
+        first. For :class:`~spans.settypes.intrangeset` every range is iterated
+        over using the builtin :class:`range` type.
         """
 
-        return chain(*self)
+        return chain.from_iterable(self._list)
 
 
 @MetaRangeSet.register(OffsetableRangeMixin)
@@ -121,10 +367,84 @@ class OffsetableRangeSetMixin(object):
         is not done in place.
         """
 
-        return self.__class__(r.offset(offset) for r in self)
+        return self.from_ranges((r.offset(offset) for r in self), presorted=True)
+
+    def measure(self):
+        """
+        Returns the total length of the ranges in this range set.
+
+            >>> intrangeset([intrange(1, 5), intrange(10, 15)]).measure()
+            9
+            >>> datetimerangeset([
+            ...     datetimerange(datetime(2000, 1, 1, 8), datetime(2000, 1, 1, 12)),
+            ...     datetimerange(datetime(2000, 1, 1, 13), datetime(2000, 1, 1, 17)),
+            ... ]).measure()
+            datetime.timedelta(seconds=28800)
+
+        The length is of the same type as the offsets of the range type, i.e.
+        ``int`` for :class:`~spans.settypes.intrangeset`, ``float`` for
+        :class:`~spans.settypes.floatrangeset` and ``datetime.timedelta`` for
+        date, datetime and timedelta range sets. An empty set has a length of
+        zero.
+
+        The result is cached until the set is modified. When the columns used
+        by :meth:`~spans.settypes.RangeSet.contains_many` are already available,
+        the lengths are added using NumPy.
+
+        :return: Total length of this range set.
+        :raises ValueError: If this range set is unbounded.
+
+        .. versionadded:: 2.0.0
+        """
+
+        if self._measure is None:
+            ranges = self._list
+            if ranges and (ranges[0].lower_inf or ranges[-1].upper_inf):
+                raise ValueError("Unbounded range sets don't have a measure")
+
+            array = self._cached_range_array()
+            if array is not None:
+                self._measure = _sorted_measure(array)
+            else:
+                offset_type = self.type.offset_type or self.type.type
+                self._measure = _measure(ranges, offset_type())
+        return self._measure
+
+
+@MetaRangeSet.register(daterange)
+class DateRangeSetMixin(object):
+    """
+    Mixin that adds support for date range set operations. Automatically used
+    by :class:`~spans.settypes.RangeSet` when range type inherits
+    :class:`~spans.types.daterange`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    def day_count(self):
+        """
+        Returns the total number of days in this range set.
+
+            >>> daterangeset([
+            ...     daterange(date(2000, 1, 1), date(2000, 2, 1)),
+            ...     daterange(date(2000, 3, 1), date(2000, 3, 8)),
+            ... ]).day_count()
+            38
+
+        Since the ranges of a set never overlap, this is the sum of the lengths
+        of its ranges. It does not iterate over the days themselves. See
+        :meth:`~spans.settypes.OffsetableRangeSetMixin.measure`.
+
+        :return: Number of days in this range set.
+        :raises ValueError: If this range set is unbounded.
+        """
+
+        return self.measure().days
 
 
-class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
+class RangeSet(metaclass=MetaRangeSet):
     """
     A range set works a lot like a range with some differences:
 
@@ -144,6 +464,8 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
 
     .. tip::
         The ``RangeSet`` constructor supports any iterable sequence as argument.
+        The ranges do not need to be sorted. They are sorted and merged in a
+        single pass. See :meth:`~spans.settypes.RangeSet.from_ranges`.
 
     :param ranges: A sequence of ranges to add to this set.
     :raises TypeError: If any of the given ranges are of incorrect type.
@@ -152,16 +474,150 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
        Changed name from ``rangeset`` to ``RangeSet``
     """
 
-    __slots__ = ("_list",)
+    __slots__ = ("_list", "_measure")
 
     def __init__(self, ranges):
-        self._list = []
+        self._set_list(self._normalize(ranges))
+
+    @classmethod
+    def from_ranges(cls, ranges, presorted=False):
+        """
+        Create a new range set from the given ranges. This works like the
+        constructor but makes it possible to skip sorting when the ranges are
+        known to be sorted already.
+
+            >>> intrangeset.from_ranges([intrange(10, 15), intrange(1, 5)])
+            intrangeset([intrange(1, 5), intrange(10, 15)])
+            >>> intrangeset.from_ranges(
+            ...     [intrange(1, 5), intrange(3, 10)], presorted=True)
+            intrangeset([intrange(1, 10)])
+
+        The ranges are sorted once and then merged in a single pass, making this
+        operation `O(n log n)` where `n` is the number of given ranges, or
+        `O(n)` when the ranges are presorted.
+
+        :param ranges: An iterable of ranges to add to the new set.
+        :param presorted: ``True`` if the given ranges are sorted by their lower
+                          bound. Overlapping and adjacent ranges are allowed.
+        :return: A new range set containing the given ranges.
+        :raises TypeError: If any of the given ranges are of incorrect type.
+        """
+
+        return cls._from_normalized(cls._normalize(ranges, presorted))
 
+    @classmethod
+    def from_arrays(cls, lower, upper, lower_inc=None, upper_inc=None):
+        """
+        Create a new range set from a sequence of lower bounds and a sequence of
+        upper bounds, like two columns of a database table. Unbounded ends are
+        given as ``None``.
+
+            >>> intrangeset.from_arrays([10, 1, 3], [15, 5, 8])
+            intrangeset([intrange(1, 8), intrange(10, 15)])
+            >>> intrangeset.from_arrays([None, 20], [0, None])
+            intrangeset([intrange(upper=0), intrange(20)])
+
+        When NumPy is installed the bounds may be given as NumPy arrays, where
+        ``NaT`` means unbounded for arrays of ``datetime64``. The bounds are
+        then validated, sorted and merged using vectorized operations, and
+        range objects are only created for the merged ranges. Without NumPy,
+        or for range types that have no :mod:`~spans.arrays` counterpart, one
+        range is created per pair of bounds. The same happens for bounds that
+        can't be stored in NumPy arrays, like timezone aware datetimes. Arrays
+        of ``datetime64`` with a finer unit than the range type, like
+        ``datetime64[ns]``, are accepted as long as no precision is lost.
+
+        :param lower: Lower bounds.
+        :param upper: Upper bounds.
+        :param lower_inc: ``True`` if the lower bounds are included. May be a
+                          single value or one value per range. By default
+                          bounded lower bounds are included.
+        :param upper_inc: ``True`` if the upper bounds are included. May be a
+                          single value or one value per range. By default upper
+                          bounds are not included.
+        :return: A new range set containing the given ranges.
+        :raises TypeError: If any bound is of the wrong type.
+        :raises ValueError: If any upper bound is less than its lower bound, or
+                            if an unbounded end is inclusive.
+
+        .. versionadded:: 2.0.0
+        """
+
+        array_type = _range_array_types.get(cls.type)
+        if np is not None and array_type is not None:
+            columns = [
+                c
+                if isinstance(c, np.ndarray) or not hasattr(c, "__iter__")
+                else list(c)
+                for c in (lower, upper, lower_inc, upper_inc)
+            ]
+            try:
+                ranges = array_type.from_arrays(*columns)
+            except (OverflowError, ValueError):
+                # Bounds that don't fit in an array, like timezone aware
+                # datetimes or huge integers, are handled one by one below
+                # instead. Typed NumPy arrays are only accepted when they can be
+                # converted exactly, so errors for them are genuine
+                if any(
+                    isinstance(c, np.ndarray) and c.dtype.kind != "O" for c in columns
+                ):
+                    raise
+            else:
+                return cls._from_range_array(_coalesce_array(ranges))
+            lower, upper, lower_inc, upper_inc = columns
+
+        lower = list(lower)
+        upper = list(upper)
+        if len(lower) != len(upper):
+            raise ValueError("Lower and upper bounds must be of the same length")
+
+        if lower_inc is None or not hasattr(lower_inc, "__iter__"):
+            lower_inc = [lower_inc] * len(lower)
+
+        if upper_inc is None or not hasattr(upper_inc, "__iter__"):
+            upper_inc = [upper_inc] * len(upper)
+
+        return cls(map(cls.type, lower, upper, lower_inc, upper_inc))
+
+    @classmethod
+    def _from_normalized(cls, ranges):
+        # Create a new range set from a list of ranges that is already sorted
+        # and does not contain any empty, overlapping or adjacent ranges
+        self = cls.__new__(cls)
+        self._set_list(ranges)
+        return self
+
+    @classmethod
+    def _from_range_array(cls, ranges):
+        # Create a new range set from a range array that is normalized the same
+        # way as the list of ranges of a range set
+        return cls._from_normalized(list(ranges))
+
+    def _set_list(self, ranges):
+        # Replace the ranges of this set with the given normalized list of
+        # ranges. Subclasses may store them in another kind of sequence
+        self._list = ranges
+        self._clear_cache()
+
+    def _clear_cache(self):
+        # Forget values computed from the ranges of this set. Must be called
+        # whenever the set is modified
+        self._measure = None
+
+    @classmethod
+    def _normalize(cls, ranges, presorted=False):
+        nonempty = []
         for r in ranges:
-            self.add(r)
+            cls._test_range_type(r)
+            if r:
+                nonempty.append(r)
+
+        if not presorted:
+            nonempty.sort(key=Range.sort_key)
+        return _coalesce(nonempty)
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self._list!r})"
+        return f"{self.__class__.__name__}({list(self._list)!r})"
 
     # Support pickling using the default ancient pickling protocol for Python 2.7
     def __getstate__(self):
@@ -173,9 +629,9 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
         # Since __getstate__ used to return a list we allow allow loading data
         # serialized by an older version of spans
         if isinstance(state, tuple):
-            self._list = state[0]
+            self._set_list(state[0])
         else:
-            self._list = state
+            self._set_list(state)
 
     def __bool__(self):
         """
@@ -211,15 +667,54 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
 
         return iter(self._list)
 
+    # Range sets are ordered like sequences of ranges. Every comparison is
+    # implemented separately to avoid having to compare the sets more than once
+
+    def _comparable_lists(self, other):
+        # Return the ranges of both sets as sequences that can be compared with
+        # each other. They are only copied when the sets store their ranges in
+        # different kinds of sequences, like a frozen and a mutable set
+        a = self._list
+        b = other._list
+        if type(a) is not type(b):
+            return tuple(a), tuple(b)
+        return a, b
+
     def __eq__(self, other):
-        if not isinstance(other, self.__class__):
+        if not self.is_valid_rangeset(other):
+            return NotImplemented
+        a, b = self._comparable_lists(other)
+        return a == b
+
+    def __ne__(self, other):
+        if not self.is_valid_rangeset(other):
             return NotImplemented
-        return self._list == other._list
+        a, b = self._comparable_lists(other)
+        return a != b
 
     def __lt__(self, other):
-        if not isinstance(other, self.__class__):
+        if not self.is_valid_rangeset(other):
             return NotImplemented
-        return self._list < other._list
+        a, b = self._comparable_lists(other)
+        return a < b
+
+    def __le__(self, other):
+        if not self.is_valid_rangeset(other):
+            return NotImplemented
+        a, b = self._comparable_lists(other)
+        return a <= b
+
+    def __gt__(self, other):
+        if not self.is_valid_rangeset(other):
+            return NotImplemented
+        a, b = self._comparable_lists(other)
+        return a > b
+
+    def __ge__(self, other):
+        if not self.is_valid_rangeset(other):
+            return NotImplemented
+        a, b = self._comparable_lists(other)
+        return a >= b
 
     def __len__(self):
         """
@@ -246,13 +741,18 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
             >>> ~intrangeset([intrange(1, 5)])
             intrangeset([intrange(upper=1), intrange(5)])
 
+        The inverted set consists of the gaps between the ranges of this set,
+        making this operation `O(n)` where `n` is the number of ranges within
+        this set.
         """
 
-        return self.__class__([self.type()]).difference(self)
+        return self._from_normalized(_complement(self._list, self.type))
 
     @classmethod
     def is_valid_rangeset(cls, obj):
-        return isinstance(obj, cls)
+        # Mutable and frozen range sets can be mixed as long as they contain the
+        # same type of ranges
+        return isinstance(obj, RangeSet) and obj.type is cls.type
 
     @classmethod
     def is_valid_range(cls, obj):
@@ -262,16 +762,18 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
     def is_valid_scalar(cls, obj):
         return cls.type.is_valid_scalar(obj)
 
-    def _test_rangeset_type(self, item):
-        if not self.is_valid_rangeset(item):
+    @classmethod
+    def _test_rangeset_type(cls, item):
+        if not cls.is_valid_rangeset(item):
             raise TypeError(
-                f"Invalid range type {item.__class__.__name__!r} expected {self.type.__name__!r}"
+                f"Invalid range type {item.__class__.__name__!r} expected {cls.type.__name__!r}"
             )
 
-    def _test_range_type(self, item):
-        if not self.is_valid_range(item):
+    @classmethod
+    def _test_range_type(cls, item):
+        if not cls.is_valid_range(item):
             raise TypeError(
-                f"Invalid range type {item.__class__.__name__!r} expected {self.type.__name__!r}"
+                f"Invalid range type {item.__class__.__name__!r} expected {cls.type.__name__!r}"
             )
 
     def copy(self):
@@ -289,7 +791,7 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
         :return: A new range set with the same ranges as this range set.
         """
 
-        return self.__class__(self)
+        return self._from_normalized(self._list[:])
 
     def contains(self, item):
         """
@@ -313,8 +815,8 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
             >>> 3 in intrangeset([intrange(1, 5)])
             True
 
-        This operation is `O(n)` where `n` is the number of ranges within this
-        range set.
+        This operation is `O(log n)` where `n` is the number of ranges within
+        this range set.
 
         :param item: Range or scalar to test for.
         :return: True if element is contained within this set.
@@ -328,11 +830,96 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
             msg = "Unsupported item type provided '{}'"
             raise ValueError(msg.format(item.__class__.__name__))
 
-        # All range sets contain the empty range
-        if not item:
-            return True
+        if self.is_valid_range(item):
+            # All range sets contain the empty range
+            if not item:
+                return True
+
+            # Since ranges within the set never overlap, the first range that
+            # is not strictly left of item is the only one that can contain it
+            i = _partition_point(self._list, lambda r: r.left_of(item))
+            return i < len(self._list) and self._list[i].contains(item)
+
+        return self._contains_scalar(item)
+
+    def _contains_scalar(self, item):
+        # Find the first range that does not end before the scalar
+        i = _partition_point(
+            self._list,
+            lambda r: not r.upper_inf
+            and (r.upper < item or (r.upper == item and not r.upper_inc)),
+        )
+        return i < len(self._list) and self._list[i].contains(item)
+
+    def contains_many(self, values):
+        """
+        Test which of the given scalars are within this set. This works
+        like calling :meth:`~spans.settypes.RangeSet.contains` for every value,
+        but is a lot faster for large numbers of values.
+
+            >>> rs = intrangeset([intrange(1, 5), intrange(10)])
+            >>> [bool(found) for found in rs.contains_many([0, 1, 5, 7, 10, 20])]
+            [False, True, False, False, True, True]
+
+        When NumPy is installed the values are tested in a single vectorized
+        pass, and a boolean NumPy array is returned. The values may be given as
+        a NumPy array as well, for instance of ``datetime64[ns]``. Ranges and
+        values that NumPy can't hold, like timezone aware datetimes, are tested
+        one by one. Without NumPy a list of booleans is returned.
+
+        :param values: Sequence of scalars to test.
+        :return: A boolean NumPy array, or a list when NumPy is not installed,
+                 with one element per value.
+        :raises TypeError: If any value is of the wrong type.
+
+        .. versionadded:: 2.0.0
+        """
+
+        ranges = self._range_array()
+        if ranges is not None:
+            if not isinstance(values, np.ndarray):
+                values = list(values)
+
+            try:
+                return _sorted_contains(ranges, values)
+            except (OverflowError, ValueError):
+                # Some values can't be stored in a NumPy array, like integers
+                # that don't fit in 64 bits or timezone aware datetimes. They
+                # are tested one by one instead
+                pass
+
+        found = []
+        for value in values:
+            if not self.is_valid_scalar(value):
+                raise TypeError(
+                    f"Unsupported type to test for inclusion"
+                    f" {value.__class__.__name__!r}"
+                )
+            found.append(self._contains_scalar(value))
+
+        if np is None:
+            return found
+        return np.array(found, dtype=bool)
+
+    def _range_array(self):
+        # Return the ranges of this set as a range array, or None if NumPy is
+        # not installed, there is no range array for this type of range or the
+        # ranges can't be stored in one
+        array_type = _range_array_types.get(self.type)
+        if np is None or array_type is None:
+            return None
+
+        try:
+            return array_type(self._list)
+        except (OverflowError, ValueError):
+            # Integers that don't fit in 64 bits and timezone aware datetimes
+            # can't be stored as columns
+            return None
 
-        return any(r.contains(item) for r in self._list)
+    def _cached_range_array(self):
+        # Return the ranges of this set as a range array if it has already been
+        # created, or None. Mutable sets never keep their range array around
+        return None
 
     def add(self, item):
         """
@@ -349,7 +936,10 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
             >>> rs
             intrangeset([intrange(1, 15), intrange(20, 30)])
 
-        This operation updates the set in place.
+        This operation updates the set in place. The position of the range is
+        found using binary search, making this operation `O(log n + k)` where `n`
+        is the number of ranges within this set and `k` is the number of ranges
+        that are merged with the added range.
 
         :param item: Range to add to this set.
         :raises TypeError: If any of the given ranges are of incorrect type.
@@ -361,33 +951,26 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
         if not item:
             return
 
-        i = 0
-        buffer = []
-        while i < len(self._list):
-            r = self._list[i]
-
-            if r.overlap(item) or r.adjacent(item):
-                buffer.append(self._list.pop(i))
-                continue
-            elif item.left_of(r):
-                # If there are buffered items we must break here for the buffer
-                # to be inserted
-                if not buffer:
-                    self._list.insert(i, item)
-                break
-            i += 1
-        else:
-            # The list was exausted and the range should be appended unless there
-            # are ranges in the buffer
-            if not buffer:
-                self._list.append(item)
-
-        # Process the buffer
-        if buffer:
-            # Unify the buffer
-            for r in buffer:
-                item = item.union(r)
-            self.add(item)
+        # Ranges strictly to the left of item, and not adjacent to it, are
+        # unaffected. The same goes for ranges strictly to the right of item.
+        # Everything in between must be merged with item
+        lo = _partition_point(
+            self._list,
+            lambda r: r.left_of(item) and not r.adjacent(item),
+        )
+        hi = _partition_point(
+            self._list,
+            lambda r: not item.left_of(r) or item.adjacent(r),
+            lo,
+        )
+
+        # Since the ranges in the set are sorted and item touches all of them
+        # it is enough to unify it with the first and the last one
+        if lo < hi:
+            item = item.union(self._list[lo]).union(self._list[hi - 1])
+
+        self._list[lo:hi] = [item]
+        self._clear_cache()
 
     def remove(self, item):
         """
@@ -398,45 +981,25 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
             >>> rs
             intrangeset([intrange(1, 5), intrange(10, 15)])
 
+        The affected ranges are found using binary search, making this
+        operation `O(log n + k)` where `n` is the number of ranges within this
+        set and `k` is the number of ranges that overlap the removed range.
+
         :param item: Range to remove from this set.
+        :raises TypeError: If the range is of incorrect type.
         """
 
         self._test_range_type(item)
 
-        # If the list currently only have an empty range do nothing since an
-        # empty RangeSet can't be removed from anyway.
-        if not self:
+        # Removing the empty range is a no-op
+        if not item:
             return
 
-        i = 0
-        while i < len(self._list):
-            r = self._list[i]
-            if item.left_of(r):
-                break
-            elif item.overlap(r):
-                try:
-                    self._list[i] = r.difference(item)
-
-                    # If the element becomes empty remove it entirely
-                    if not self._list[i]:
-                        del self._list[i]
-                        continue
-                except ValueError:
-                    # The range was within the range, causing it to be split so
-                    # we do this split manually
-                    del self._list[i]
-                    self._list.insert(
-                        i,
-                        r.replace(lower=item.upper, lower_inc=not item.upper_inc),
-                    )
-                    self._list.insert(
-                        i,
-                        r.replace(upper=item.lower, upper_inc=not item.lower_inc),
-                    )
-
-                    # When this happens we know we are done
-                    break
-            i += 1
+        # Only ranges overlapping item are affected by this
+        lo = _partition_point(self._list, lambda r: r.left_of(item))
+        hi = _partition_point(self._list, lambda r: not item.left_of(r), lo)
+        self._list[lo:hi] = _subtract(self._list[lo:hi], [item])
+        self._clear_cache()
 
     def span(self):
         """
@@ -463,10 +1026,7 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
         if not self:
             return self.type.empty()
 
-        return self._list[0].replace(
-            upper=self._list[-1].upper,
-            upper_inc=self._list[-1].upper_inc,
-        )
+        return _span(self._list[0], self._list[-1])
 
     def union(self, *others):
         """
@@ -477,17 +1037,16 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
             ...     intrangeset([intrange(5, 10)]))
             intrangeset([intrange(1, 10)])
 
+        Since all sets are already normalized this is done by walking through
+        all sets at the same time, making this operation `O(n log k)` where `n`
+        is the total number of ranges within the sets and `k` is the number of
+        sets.
+
         :param other: Range set to merge with.
         :return: A new range set that is the union of this and `other`.
         """
 
-        # Make a copy of self and add all its ranges to the copy
-        union = self.copy()
-        for other in others:
-            self._test_rangeset_type(other)
-            for r in other:
-                union.add(r)
-        return union
+        return self._new(self._union(others))
 
     def difference(self, *others):
         """
@@ -498,17 +1057,16 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
             ...     intrangeset([intrange(5, 10)]))
             intrangeset([intrange(1, 5), intrange(10, 15)])
 
+        Since all sets are already normalized this is done by walking through
+        all sets at the same time, making this operation `O(n log k)` where `n`
+        is the total number of ranges within the sets and `k` is the number of
+        sets.
+
         :param other: Range set to compute difference against.
         :return: A new range set that is the difference between this and `other`.
         """
 
-        # Make a copy of self and remove all its ranges from the copy
-        difference = self.copy()
-        for other in others:
-            self._test_rangeset_type(other)
-            for r in other:
-                difference.remove(r)
-        return difference
+        return self._new(self._difference(others))
 
     def intersection(self, *others):
         """
@@ -518,41 +1076,164 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
             ...     intrangeset([intrange(5, 10)]))
             intrangeset([intrange(5, 10)])
 
+        Since all sets are already normalized this is done by walking through
+        all sets at the same time, making this operation `O(n log k)` where `n`
+        is the total number of ranges within the sets and `k` is the number of
+        sets.
+
         :param other: Range set to intersect this range set with.
         :return: A new range set that is the intersection between this and
                  `other`.
         """
 
-        # Initialize output with a reference to this RangeSet. When
-        # intersecting against multiple RangeSets at once this will be replaced
-        # after each iteration.
-        output = self
+        return self._new(self._intersection(others))
+
+    def symmetric_difference(self, other):
+        """
+        Returns a new set of all subsets that exist in either this or the given
+        set, but not in both.
+
+            >>> intrangeset([intrange(1, 10)]).symmetric_difference(
+            ...     intrangeset([intrange(5, 15)]))
+            intrangeset([intrange(1, 5), intrange(10, 15)])
+
+        :param other: Range set to compute symmetric difference against.
+        :return: A new range set that is the symmetric difference between this
+                 and `other`.
+
+        .. versionadded:: 2.0.0
+        """
+
+        return self._new(self._symmetric_difference(other))
+
+    def update(self, *others):
+        """
+        Updates this set with the union of itself and every given set.
+
+            >>> rs = intrangeset([intrange(1, 5)])
+            >>> rs.update(intrangeset([intrange(5, 10)]))
+            >>> rs
+            intrangeset([intrange(1, 10)])
+
+        This operation updates the set in place. It can also be called using
+        the ``|=`` operator.
+
+        :param other: Range set to merge with.
+
+        .. versionadded:: 2.0.0
+        """
+
+        self._set_list(self._union(others))
+
+    def difference_update(self, *others):
+        """
+        Removes every subset that is in any of the given sets from this set.
+
+            >>> rs = intrangeset([intrange(1, 15)])
+            >>> rs.difference_update(intrangeset([intrange(5, 10)]))
+            >>> rs
+            intrangeset([intrange(1, 5), intrange(10, 15)])
+
+        This operation updates the set in place. It can also be called using
+        the ``-=`` operator.
+
+        :param other: Range set to compute difference against.
+
+        .. versionadded:: 2.0.0
+        """
+
+        self._set_list(self._difference(others))
 
+    def intersection_update(self, *others):
+        """
+        Keeps only the subsets of this set that exist in every given set.
+
+            >>> rs = intrangeset([intrange(1, 15)])
+            >>> rs.intersection_update(intrangeset([intrange(5, 10)]))
+            >>> rs
+            intrangeset([intrange(5, 10)])
+
+        This operation updates the set in place. It can also be called using
+        the ``&=`` operator.
+
+        :param other: Range set to intersect this range set with.
+
+        .. versionadded:: 2.0.0
+        """
+
+        self._set_list(self._intersection(others))
+
+    def symmetric_difference_update(self, other):
+        """
+        Updates this set to only contain subsets that exist in either this or
+        the given set, but not in both.
+
+            >>> rs = intrangeset([intrange(1, 10)])
+            >>> rs.symmetric_difference_update(intrangeset([intrange(5, 15)]))
+            >>> rs
+            intrangeset([intrange(1, 5), intrange(10, 15)])
+
+        This operation updates the set in place. It can also be called using
+        the ``^=`` operator.
+
+        :param other: Range set to compute symmetric difference against.
+
+        .. versionadded:: 2.0.0
+        """
+
+        self._set_list(self._symmetric_difference(other))
+
+    def _new(self, ranges):
+        # Wrap the result of a set operation in a new range set. The new set
+        # must never share its list with this set
+        if ranges is self._list:
+            ranges = ranges[:]
+        return self._from_normalized(ranges)
+
+    def _union(self, others):
         for other in others:
             self._test_rangeset_type(other)
 
-            # Intermediate RangeSet containing intersection for this current
-            # iteration.
-            intersection = self.__class__([])
+        if not others:
+            return self._list
 
-            # Intersect every range within the current output with every range
-            # within the currently processed other RangeSet. All intersecting
-            # parts are added to the intermediate intersection set.
-            for a in output:
-                for b in other:
-                    intersection.add(a.intersection(b))
+        return _union_all([self._list] + [other._list for other in others])
 
-            # If the intermediate intersection RangeSet is still empty, there
-            # where no intersections with at least one of the arguments and
-            # we can quit early, since any intersection with the empty set will
-            # always be empty.
-            if not intersection:
-                return intersection
+    def _difference(self, others):
+        for other in others:
+            self._test_rangeset_type(other)
+
+        if not others or not self._list:
+            return self._list
+        elif len(others) == 1:
+            return _subtract(self._list, others[0]._list)
 
-            # Update output with intersection for the current iteration.
-            output = intersection
+        # Removing every set one by one is the same as removing their union
+        return _subtract(self._list, _union_all([other._list for other in others]))
+
+    def _intersection(self, others):
+        for other in others:
+            self._test_rangeset_type(other)
 
-        return output
+        if not others:
+            return self._list
+        elif len(others) == 1:
+            return _intersect(self._list, others[0]._list)
+
+        return _intersect_all([self._list] + [other._list for other in others])
+
+    def _symmetric_difference(self, other):
+        self._test_rangeset_type(other)
+
+        # Parts of the two differences may be adjacent to each other, which is
+        # why they must be coalesced
+        return _coalesce(
+            heapq.merge(
+                _subtract(self._list, other._list),
+                _subtract(other._list, self._list),
+                key=Range.sort_key,
+            )
+        )
 
     def __or__(self, other):
         try:
@@ -572,6 +1253,40 @@ class RangeSet(PartialOrderingMixin, metaclass=MetaRangeSet):
         except TypeError:
             return NotImplemented
 
+    def __xor__(self, other):
+        try:
+            return self.symmetric_difference(other)
+        except TypeError:
+            return NotImplemented
+
+    def __ior__(self, other):
+        try:
+            self.update(other)
+        except TypeError:
+            return NotImplemented
+        return self
+
+    def __iand__(self, other):
+        try:
+            self.intersection_update(other)
+        except TypeError:
+            return NotImplemented
+        return self
+
+    def __isub__(self, other):
+        try:
+            self.difference_update(other)
+        except TypeError:
+            return NotImplemented
+        return self
+
+    def __ixor__(self, other):
+        try:
+            self.symmetric_difference_update(other)
+        except TypeError:
+            return NotImplemented
+        return self
+
     # ``in`` operator support
     __contains__ = contains
 
@@ -638,8 +1353,9 @@ class daterangeset(RangeSet):
             daterange(datetime.date(2001, 1, 1), datetime.date(2001, 2, 1))])
 
     Inherits methods from :class:`~spans.settypes.RangeSet`,
-    :class:`~spans.settypes.DiscreteRangeset` and
-    :class:`~spans.settypes.OffsetableRangeMixinset`.
+    :class:`~spans.settypes.DiscreteRangeset`,
+    :class:`~spans.settypes.OffsetableRangeMixinset` and
+    :class:`~spans.settypes.DateRangeSetMixin`.
     """
 
     __slots__ = ()
@@ -682,6 +1398,315 @@ class timedeltarangeset(RangeSet):
     type = timedeltarange
 
 
+class FrozenRangeSet(RangeSet):
+    """
+    An immutable and hashable range set. It relates to
+    :class:`~spans.settypes.RangeSet` the way ``frozenset`` relates to ``set``.
+    All methods that update the set in place raise ``TypeError``.
+
+        >>> rs = frozenintrangeset([intrange(1, 5)])
+        >>> {rs: "value"}[frozenintrangeset([intrange(1, 5)])]
+        'value'
+        >>> rs.add(intrange(5, 10))
+        Traceback (most recent call last):
+          File "<stdin>", line 1, in <module>
+        TypeError: 'frozenintrangeset' object is immutable
+
+    The hash, :meth:`~spans.settypes.RangeSet.span`, the inverted set,
+    :meth:`~spans.settypes.OffsetableRangeSetMixin.measure` and the columns
+    used by :meth:`~spans.settypes.RangeSet.contains_many` are computed once
+    and then cached. Set operations return a new range set of the
+    same class as the left operand, which makes it possible to mix frozen and
+    mutable range sets:
+
+        >>> rs | intrangeset([intrange(5, 10)])
+        frozenintrangeset([intrange(1, 10)])
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ("_hash", "_span", "_inverted", "_array")
+
+    def _set_list(self, ranges):
+        super(FrozenRangeSet, self)._set_list(tuple(ranges))
+
+    def _clear_cache(self):
+        super(FrozenRangeSet, self)._clear_cache()
+        self._hash = None
+        self._span = None
+        self._inverted = None
+        self._array = None
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._list)
+        return self._hash
+
+    def __invert__(self):
+        if self._inverted is None:
+            self._inverted = super(FrozenRangeSet, self).__invert__()
+            self._inverted._inverted = self
+        return self._inverted
+
+    def _new(self, ranges):
+        # Since the set is immutable there is no need to copy it when the result
+        # is identical
+        if ranges is self._list:
+            return self
+        return self._from_normalized(ranges)
+
+    def copy(self):
+        return self
+
+    def span(self):
+        if self._span is None:
+            self._span = super(FrozenRangeSet, self).span()
+        return self._span
+
+    def _range_array(self):
+        if self._array is None:
+            # Sets that can't be stored as a range array are marked using False
+            # to avoid trying again
+            array = super(FrozenRangeSet, self)._range_array()
+            self._array = False if array is None else array
+        return self._cached_range_array()
+
+    def _cached_range_array(self):
+        return None if self._array is False else self._array
+
+    def _immutable(self, *args):
+        raise TypeError(f"{self.__class__.__name__!r} object is immutable")
+
+    add = _immutable
+    remove = _immutable
+    update = _immutable
+    difference_update = _immutable
+    intersection_update = _immutable
+    symmetric_difference_update = _immutable
+
+    # Like frozenset the in place operators return a new set
+    __ior__ = RangeSet.__or__
+    __iand__ = RangeSet.__and__
+    __isub__ = RangeSet.__sub__
+    __ixor__ = RangeSet.__xor__
+
+
+class frozenintrangeset(FrozenRangeSet):
+    """
+    Frozen range set that operates on :class:`~spans.types.intrange`.
+
+        >>> frozenintrangeset([intrange(1, 5), intrange(10, 15)])
+        frozenintrangeset([intrange(1, 5), intrange(10, 15)])
+
+    Inherits methods from :class:`~spans.settypes.FrozenRangeSet`,
+    :class:`~spans.settypes.DiscreteRangeSetMixin` and
+    :class:`~spans.settypes.OffsetableRangeSetMixin`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = intrange
+
+
+class frozenfloatrangeset(FrozenRangeSet):
+    """
+    Frozen range set that operates on :class:`~spans.types.floatrange`.
+
+        >>> frozenfloatrangeset([floatrange(1.0, 5.0), floatrange(10.0, 15.0)])
+        frozenfloatrangeset([floatrange(1.0, 5.0), floatrange(10.0, 15.0)])
+
+    Inherits methods from :class:`~spans.settypes.FrozenRangeSet` and
+    :class:`~spans.settypes.OffsetableRangeSetMixin`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = floatrange
+
+
+class frozenstrrangeset(FrozenRangeSet):
+    """
+    Frozen range set that operates on :class:`~spans.types.strrange`.
+
+        >>> frozenstrrangeset([strrange("a", "f"), strrange("0", "9")])
+        frozenstrrangeset([strrange('0', '9'), strrange('a', 'f')])
+
+    Inherits methods from :class:`~spans.settypes.FrozenRangeSet` and
+    :class:`~spans.settypes.DiscreteRangeSetMixin`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = strrange
+
+
+class frozendaterangeset(FrozenRangeSet):
+    """
+    Frozen range set that operates on :class:`~spans.types.daterange`.
+
+        >>> month = daterange(date(2000, 1, 1), date(2000, 2, 1))
+        >>> frozendaterangeset([month, month.offset(timedelta(366))]) # doctest: +NORMALIZE_WHITESPACE
+        frozendaterangeset([daterange(datetime.date(2000, 1, 1), datetime.date(2000, 2, 1)),
+            daterange(datetime.date(2001, 1, 1), datetime.date(2001, 2, 1))])
+
+    Inherits methods from :class:`~spans.settypes.FrozenRangeSet`,
+    :class:`~spans.settypes.DiscreteRangeSetMixin`,
+    :class:`~spans.settypes.OffsetableRangeSetMixin` and
+    :class:`~spans.settypes.DateRangeSetMixin`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = daterange
+
+
+class frozendatetimerangeset(FrozenRangeSet):
+    """
+    Frozen range set that operates on :class:`~spans.types.datetimerange`.
+
+        >>> month = datetimerange(datetime(2000, 1, 1), datetime(2000, 2, 1))
+        >>> frozendatetimerangeset([month]) # doctest: +NORMALIZE_WHITESPACE
+        frozendatetimerangeset([datetimerange(datetime.datetime(2000, 1, 1, 0, 0),
+            datetime.datetime(2000, 2, 1, 0, 0))])
+
+    Inherits methods from :class:`~spans.settypes.FrozenRangeSet` and
+    :class:`~spans.settypes.OffsetableRangeSetMixin`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = datetimerange
+
+
+class frozentimedeltarangeset(FrozenRangeSet):
+    """
+    Frozen range set that operates on :class:`~spans.types.timedeltarange`.
+
+        >>> week = timedeltarange(timedelta(0), timedelta(7))
+        >>> frozentimedeltarangeset([week, week.offset(timedelta(7))])
+        frozentimedeltarangeset([timedeltarange(datetime.timedelta(0), datetime.timedelta(days=14))])
+
+    Inherits methods from :class:`~spans.settypes.FrozenRangeSet` and
+    :class:`~spans.settypes.OffsetableRangeSetMixin`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = timedeltarange
+
+
+class CompactRangeSet(RangeSet):
+    """
+    A range set that stores its ranges in a compact form. It works exactly like
+    a :class:`~spans.settypes.RangeSet` of the same range type, but uses a lot
+    less memory when it contains many ranges.
+
+        >>> rs = compactintrangeset([intrange(1, 5), intrange(10)])
+        >>> rs.add(intrange(5, 8))
+        >>> rs
+        compactintrangeset([intrange(1, 8), intrange(10)])
+        >>> rs == intrangeset([intrange(1, 8), intrange(10)])
+        True
+
+    Instead of a list of ranges, the bounds are stored as parallel arrays from
+    the ``array`` module, along with a byte of flags per range. This takes 17
+    bytes per range, compared to well over a hundred bytes for a range object.
+    Ranges are created on access, which makes iterating and set operations
+    somewhat slower than for regular range sets. When NumPy is installed
+    :meth:`~spans.settypes.RangeSet.contains_many` and
+    :meth:`~spans.settypes.OffsetableRangeSetMixin.measure` use the arrays
+    directly.
+
+    :param ranges: A sequence of ranges to add to this set.
+    :raises TypeError: If any of the given ranges are of incorrect type.
+    :raises OverflowError: If any bound does not fit in the array type.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    #: Type code of the ``array`` module arrays used to store bounds
+    typecode = None
+
+    def _set_list(self, ranges):
+        if not isinstance(ranges, CompactRangeList):
+            ranges = CompactRangeList.from_ranges(self.type, self.typecode, ranges)
+        super(CompactRangeSet, self)._set_list(ranges)
+
+    @classmethod
+    def _from_range_array(cls, ranges):
+        return cls._from_normalized(_to_compact(ranges, cls.typecode))
+
+    def _contains_scalar(self, item):
+        i = self._list.bisect_upper(item)
+        return i < len(self._list) and self._list[i].contains(item)
+
+    def _range_array(self):
+        array_type = _range_array_types.get(self.type)
+        if np is None or array_type is None:
+            return None
+        return _from_compact(array_type, self._list)
+
+    def _cached_range_array(self):
+        # Creating the columns only copies the bound arrays, which is a lot
+        # cheaper than going through the ranges
+        return self._range_array()
+
+
+class compactintrangeset(CompactRangeSet):
+    """
+    Compact range set that operates on :class:`~spans.types.intrange`. Bounds
+    are stored as signed 64 bit integers.
+
+        >>> compactintrangeset([intrange(1, 5), intrange(10, 15)])
+        compactintrangeset([intrange(1, 5), intrange(10, 15)])
+
+    Inherits methods from :class:`~spans.settypes.CompactRangeSet`,
+    :class:`~spans.settypes.DiscreteRangeSetMixin` and
+    :class:`~spans.settypes.OffsetableRangeSetMixin`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = intrange
+    typecode = "q"
+
+
+class compactfloatrangeset(CompactRangeSet):
+    """
+    Compact range set that operates on :class:`~spans.types.floatrange`. Bounds
+    are stored as 64 bit floats.
+
+        >>> compactfloatrangeset([floatrange(1.0, 5.0), floatrange(10.0, 15.0)])
+        compactfloatrangeset([floatrange(1.0, 5.0), floatrange(10.0, 15.0)])
+
+    Inherits methods from :class:`~spans.settypes.CompactRangeSet` and
+    :class:`~spans.settypes.OffsetableRangeSetMixin`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ()
+
+    type = floatrange
+    typecode = "d"
+
+
 # Legacy names
 
 #: This alias exist for legacy reasons. It is considered deprecated but will not
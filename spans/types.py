@@ -2,9 +2,10 @@ import operator
 import sys
 from collections import namedtuple
 from datetime import date, datetime, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
+from itertools import count
 
-from ._utils import PartialOrderingMixin, PicklableSlotMixin, date_from_iso_week
+from ._utils import PicklableSlotMixin, date_from_iso_week
 
 __all__ = [
     "intrange",
@@ -23,8 +24,11 @@ _internal_range = namedtuple(
 )
 _empty_internal_range = _internal_range(None, None, False, False, True)
 
+# Sentinel for arguments that were not given, since None is a valid bound
+_UNSET = object()
 
-class _Bound(PartialOrderingMixin):
+
+class _Bound(object):
     __slots__ = ("value", "inc", "is_lower")
 
     def __init__(self, value, inc, is_lower):
@@ -36,42 +40,53 @@ class _Bound(PartialOrderingMixin):
         rep = "_Bound({0.value!r}, inc={0.inc!r}, is_lower={0.is_lower!r})"
         return rep.format(self)
 
-    def __lt__(self, other):
-        # We need special cases when dealing with infinities
+    def _cmp(self, other):
+        # We need special cases when dealing with infinities. Lower infinity is
+        # less than everything but itself and upper infinity is greater than
+        # everything but itself
         if self.value is None:
-            # If we are lower infinity we are always less than other, unless
-            # other is also lower infinity. If we are upper infinity nothing
-            # we can never be smaller than anything
-            if self.is_lower:
-                return other.value is not None or not other.is_lower
-            else:
-                return False
-
-        if other.value is None:
-            if other.is_lower:
-                return False
-            else:
-                return self.value is not None or self.is_lower
+            if other.value is None and self.is_lower == other.is_lower:
+                return 0
+            return -1 if self.is_lower else 1
+        elif other.value is None:
+            return 1 if other.is_lower else -1
 
         if self.value < other.value:
-            return True
-        elif self.value == other.value:
-            if self.is_lower:
-                if self.inc:
-                    return other.is_lower ^ other.inc
-                return False
-            else:
-                if self.inc:
-                    return other.is_lower and not other.inc
-                return other.is_lower or other.inc
-        else:
-            return False
+            return -1
+        elif other.value < self.value:
+            return 1
+
+        # For bounds with the same value the order is: exclusive upper bound,
+        # inclusive lower bound, inclusive upper bound and exclusive lower bound
+        return self._rank() - other._rank()
+
+    def _rank(self):
+        if self.is_lower:
+            return 3 - 2 * self.inc
+        return 2 * self.inc
 
     def __eq__(self, other):
-        return all(
-            getattr(self, attr) == getattr(other, attr) for attr in _Bound.__slots__
+        return (
+            self.value == other.value
+            and self.inc == other.inc
+            and self.is_lower == other.is_lower
         )
 
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __lt__(self, other):
+        return self._cmp(other) < 0
+
+    def __le__(self, other):
+        return self._cmp(other) <= 0
+
+    def __gt__(self, other):
+        return self._cmp(other) > 0
+
+    def __ge__(self, other):
+        return self._cmp(other) >= 0
+
     def adjacent(self, other):
         if self.value is None or other.value is None:
             return False
@@ -85,7 +100,84 @@ class _Bound(PartialOrderingMixin):
         return self.inc != other.inc
 
 
-class Range(PartialOrderingMixin, PicklableSlotMixin):
+# The following helpers compare bounds of non-empty internal ranges directly,
+# without creating _Bound objects. They must give the same results as comparing
+# the corresponding _Bound objects. Unbounded ends are stored as None, which
+# means that the lower bound is negative infinity and the upper bound is
+# positive infinity
+
+
+def _cmp_lower(a, b):
+    """
+    Compare the lower bounds of the given internal ranges. Returns a negative
+    number if a starts before b, zero if they start at the same point and a
+    positive number if a starts after b.
+    """
+
+    if a.lower is None:
+        return 0 if b.lower is None else -1
+    elif b.lower is None:
+        return 1
+    elif a.lower < b.lower:
+        return -1
+    elif b.lower < a.lower:
+        return 1
+
+    # An inclusive lower bound starts before an exclusive one
+    return b.lower_inc - a.lower_inc
+
+
+def _cmp_upper(a, b):
+    """
+    Compare the upper bounds of the given internal ranges. Returns a negative
+    number if a ends before b, zero if they end at the same point and a
+    positive number if a ends after b.
+    """
+
+    if a.upper is None:
+        return 0 if b.upper is None else 1
+    elif b.upper is None:
+        return -1
+    elif a.upper < b.upper:
+        return -1
+    elif b.upper < a.upper:
+        return 1
+
+    # An inclusive upper bound ends after an exclusive one
+    return a.upper_inc - b.upper_inc
+
+
+def _ends_before_start(a, b):
+    """
+    Return True if the upper bound of the internal range a is before the lower
+    bound of the internal range b. This means that a is strictly left of b.
+    """
+
+    if a.upper is None or b.lower is None:
+        return False
+    elif a.upper < b.lower:
+        return True
+    elif a.upper == b.lower:
+        # The ranges share a point only if both bounds are inclusive
+        return not (a.upper_inc and b.lower_inc)
+    return False
+
+
+def _touches(a, b):
+    """
+    Return True if the upper bound of the internal range a is directly next to
+    the lower bound of the internal range b, without overlapping it.
+    """
+
+    return (
+        a.upper is not None
+        and b.lower is not None
+        and a.upper == b.lower
+        and a.upper_inc != b.lower_inc
+    )
+
+
+class Range(PicklableSlotMixin):
     """
     Abstract base class of all ranges.
 
@@ -93,7 +185,11 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
     must be of the given class or subclass or ``None``.
 
     All ranges are immutable. No default methods modify the range in place.
-    Instead it returns a new instance.
+    Instead it returns a new instance. Since ranges are immutable they are also
+    hashable, which means they can be used in sets and as dictionary keys.
+
+        >>> len({intrange(1, 5), intrange(1, 5), intrange(5, 10)})
+        2
 
     :param lower: Lower end of range.
     :param upper: Upper end of range.
@@ -113,7 +209,8 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
        this class is abstract.
     """
 
-    __slots__ = ("_range",)
+    # The hash is computed on first use and then cached in _hash
+    __slots__ = ("_range", "_hash")
 
     def __init__(self, lower=None, upper=None, lower_inc=None, upper_inc=None):
         if lower is not None and not isinstance(lower, self.type):
@@ -168,8 +265,16 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
         returned as ``None``. Every set contains the empty set.
         """
 
+        return cls._from_internal(_empty_internal_range)
+
+    @classmethod
+    def _from_internal(cls, internal_range):
+        # Create a new range directly from an internal range. This bypasses all
+        # validation and normalization, which means that the internal range
+        # must already be valid and normalized for this range type. Use this
+        # for ranges derived from other ranges only
         self = cls.__new__(cls)
-        self._range = _empty_internal_range
+        self._range = internal_range
         return self
 
     @classmethod
@@ -180,7 +285,7 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
     def is_valid_scalar(cls, obj):
         return isinstance(obj, cls.type)
 
-    def replace(self, *args, **kwargs):
+    def replace(self, lower=_UNSET, upper=_UNSET, lower_inc=_UNSET, upper_inc=_UNSET):
         """
         replace(lower=None, upper=None, lower_inc=None, upper_inc=None)
 
@@ -197,25 +302,42 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
         Note that range objects are immutable and are never modified in place.
         """
 
-        params = {
-            k: v for k, v in zip(("lower", "upper", "lower_inc", "upper_inc"), args)
-        }
-        params.update(kwargs)
-
-        has_lower = "lower" in params
-        has_lower_inc = "lower_inc" in params
-        if not has_lower_inc and has_lower and params.get("lower") is None:
-            params["lower_inc"] = False
-
-        replacements = {
-            "lower": self.lower,
-            "upper": self.upper,
-            "lower_inc": self.lower_inc,
-            "upper_inc": self.upper_inc,
-        }
-        replacements.update(params)
+        current = self._range
 
-        return self.__class__(**replacements)
+        if lower is _UNSET:
+            lower = current.lower
+        elif lower is None and lower_inc is _UNSET:
+            lower_inc = False
+
+        if upper is _UNSET:
+            upper = current.upper
+
+        # Unbounded ends are never inclusive, even if they are stored that way
+        if lower_inc is _UNSET:
+            lower_inc = current.lower_inc and current.lower is not None
+
+        if upper_inc is _UNSET:
+            upper_inc = current.upper_inc and current.upper is not None
+
+        return self.__class__(lower, upper, lower_inc, upper_inc)
+
+    def _replace_lower(self, lower, lower_inc):
+        # Replace the lower bound of a non-empty range without any validation.
+        # The new bound must be normalized for this range type and keep the
+        # range non-empty
+        current = self._range
+        return self._from_internal(
+            _internal_range(lower, current.upper, lower_inc, current.upper_inc, False)
+        )
+
+    def _replace_upper(self, upper, upper_inc):
+        # Replace the upper bound of a non-empty range without any validation.
+        # The new bound must be normalized for this range type and keep the
+        # range non-empty
+        current = self._range
+        return self._from_internal(
+            _internal_range(current.lower, upper, current.lower_inc, upper_inc, False)
+        )
 
     def __repr__(self):
         if not self:
@@ -341,37 +463,108 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
 
         return self._range.upper is None and not self._range.empty
 
+    def _cmp(self, other):
+        # Compare two non-empty ranges by their lower bounds first and then by
+        # their upper bounds
+        cmp = _cmp_lower(self._range, other._range)
+        if cmp == 0:
+            return _cmp_upper(self._range, other._range)
+        return cmp
+
+    # Ranges are partially ordered since there is no such thing as order when
+    # dealing with empty ranges. Every comparison is implemented separately to
+    # avoid having to compare ranges more than once
+
     def __eq__(self, other):
         if not self.is_valid_range(other):
             return NotImplemented
         return self._range == other._range
 
-    def __lt__(self, other):
+    def __ne__(self, other):
         if not self.is_valid_range(other):
             return NotImplemented
+        return self._range != other._range
 
-        # When dealing with empty ranges there is not such thing as order
+    def __lt__(self, other):
+        if not self.is_valid_range(other):
+            return NotImplemented
         if not self or not other:
             return False
+        return self._cmp(other) < 0
 
-        if self._lower_bound == other._lower_bound:
-            return self._upper_bound < other._upper_bound
-        else:
-            return self._lower_bound < other._lower_bound
+    def __le__(self, other):
+        if not self.is_valid_range(other):
+            return NotImplemented
+        if not self or not other:
+            # The empty range is only equal to itself
+            return not self and not other
+        return self._cmp(other) <= 0
 
     def __gt__(self, other):
-        # We need to implement __gt__ even though we inherit from
-        # PartialOrderingMixin since ranges are partially ordered (we can't
-        # order empty ranges)
         if not self.is_valid_range(other):
             return NotImplemented
-
-        # When dealing with empty ranges there is not such thing as order
         if not self or not other:
             return False
+        return self._cmp(other) > 0
+
+    def __ge__(self, other):
+        if not self.is_valid_range(other):
+            return NotImplemented
+        if not self or not other:
+            return not self and not other
+        return self._cmp(other) >= 0
+
+    def sort_key(self):
+        """
+        Returns a key that orders ranges the same way as ``<`` does. This makes
+        it possible to sort ranges using tuple comparisons, which is a lot
+        faster than comparing the ranges themselves.
+
+            >>> ranges = [floatrange(5.0, 10.0), floatrange(upper=1.0),
+            ...     floatrange(5.0, 7.0)]
+            >>> sorted(ranges, key=floatrange.sort_key)
+            [floatrange(upper=1.0), floatrange(5.0, 7.0), floatrange(5.0, 10.0)]
+
+        Empty ranges are placed before every other range.
+
+        :return: A tuple that can be compared against the sort key of other
+                 ranges of the same type.
+
+        .. versionadded:: 2.0.0
+        """
+
+        lower, upper, lower_inc, upper_inc, empty = self._range
+        if empty:
+            return ()
+
+        # Every bound is represented as an infinity marker, its value and its
+        # rank. The value is only compared when the markers are equal, which
+        # means that None is never compared against an actual value. At the same
+        # value an inclusive lower bound starts before an exclusive one, and an
+        # exclusive upper bound ends before an inclusive one
+        return (
+            0 if lower is None else 1,
+            lower,
+            not lower_inc,
+            2 if upper is None else 1,
+            upper,
+            upper_inc,
+        )
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self._range)
+            return self._hash
+
+    def __getstate__(self):
+        state = super(Range, self).__getstate__()
 
-        # Use PartialOrderingMixin's implementation
-        return super(Range, self).__gt__(other)
+        # The hash of strings differ between Python processes, which is why the
+        # cached hash must never be pickled
+        state.pop("_hash", None)
+        return state
 
     def __bool__(self):
         return not self._range.empty
@@ -410,8 +603,8 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
             if not self or not other:
                 return not other
             return (
-                self._lower_bound <= other._lower_bound
-                and other._upper_bound <= self._upper_bound
+                _cmp_lower(self._range, other._range) <= 0
+                and _cmp_upper(self._range, other._range) >= 0
             )
         elif self.is_valid_scalar(other):
             # If the lower bounary is not unbound we can safely perform the
@@ -490,12 +683,10 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
         if not self or not other:
             return False
 
-        sl = self._lower_bound
-        su = self._upper_bound
-        ol = other._lower_bound
-        ou = other._upper_bound
-
-        return sl < ou and ol < su
+        # Ranges overlap unless one of them ends before the other starts
+        return not _ends_before_start(
+            self._range, other._range
+        ) and not _ends_before_start(other._range, self._range)
 
     def adjacent(self, other):
         """
@@ -526,9 +717,9 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
         # Must return False if either is an empty set
         elif not self or not other:
             return False
-        return self._lower_bound.adjacent(
-            other._upper_bound
-        ) or self._upper_bound.adjacent(other._lower_bound)
+        return _touches(self._range, other._range) or _touches(
+            other._range, self._range
+        )
 
     def union(self, other):
         """
@@ -569,13 +760,18 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
         if not self.overlap(other) and not self.adjacent(other):
             raise ValueError("Ranges must be either adjacent or overlapping")
 
-        lower_bound = min(self._lower_bound, other._lower_bound)
-        upper_bound = max(self._upper_bound, other._upper_bound)
-        return self.__class__(
-            lower_bound.value,
-            upper_bound.value,
-            lower_bound.inc,
-            upper_bound.inc,
+        # The bounds are taken as is from the internal ranges of the given
+        # ranges, which means they are already normalized
+        lower = self if _cmp_lower(self._range, other._range) <= 0 else other
+        upper = self if _cmp_upper(self._range, other._range) >= 0 else other
+        return self._from_internal(
+            _internal_range(
+                lower._range.lower,
+                upper._range.upper,
+                lower._range.lower_inc,
+                upper._range.upper_inc,
+                False,
+            )
         )
 
     def difference(self, other):
@@ -623,10 +819,28 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
             return self.empty()
         elif other in self and not (self.startswith(other) or self.endswith(other)):
             raise ValueError("Other range must not be within this range")
+        # The remaining cases never result in an empty range. Other must also be
+        # bounded on the side where self is cut
         elif self.endsbefore(other):
-            return self.replace(upper=other.lower, upper_inc=not other.lower_inc)
+            return self._from_internal(
+                _internal_range(
+                    self._range.lower,
+                    other._range.lower,
+                    self._range.lower_inc,
+                    not other._range.lower_inc,
+                    False,
+                )
+            )
         elif self.startsafter(other):
-            return self.replace(lower=other.upper, lower_inc=not other.upper_inc)
+            return self._from_internal(
+                _internal_range(
+                    other._range.upper,
+                    self._range.upper,
+                    not other._range.upper_inc,
+                    self._range.upper_inc,
+                    False,
+                )
+            )
         else:
             return self.empty()
 
@@ -657,13 +871,18 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
         if not self or not other or not self.overlap(other):
             return self.empty()
 
-        lower_bound = max(self._lower_bound, other._lower_bound)
-        upper_bound = min(self._upper_bound, other._upper_bound)
-        return self.__class__(
-            lower_bound.value,
-            upper_bound.value,
-            lower_bound.inc,
-            upper_bound.inc,
+        # The ranges overlap, so the intersection can never be empty. Its bounds
+        # are taken as is from the internal ranges of the given ranges
+        lower = self if _cmp_lower(self._range, other._range) >= 0 else other
+        upper = self if _cmp_upper(self._range, other._range) <= 0 else other
+        return self._from_internal(
+            _internal_range(
+                lower._range.lower,
+                upper._range.upper,
+                lower._range.lower_inc,
+                upper._range.upper_inc,
+                False,
+            )
         )
 
     def startswith(self, other):
@@ -748,7 +967,7 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
         if self.is_valid_range(other):
             if not self or not other:
                 return False
-            return self._lower_bound >= other._lower_bound
+            return _cmp_lower(self._range, other._range) >= 0
         elif self.is_valid_scalar(other):
             if not self:
                 return False
@@ -781,7 +1000,7 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
         if self.is_valid_range(other):
             if not self or not other:
                 return False
-            return self._upper_bound <= other._upper_bound
+            return _cmp_upper(self._range, other._range) <= 0
         elif self.is_valid_scalar(other):
             if not self:
                 return False
@@ -822,7 +1041,9 @@ class Range(PartialOrderingMixin, PicklableSlotMixin):
                 f"Left of is not supported for {other.__class__.__name__}, provide a proper range class"
             )
 
-        return self._upper_bound < other._lower_bound
+        # Empty ranges have no bounds, which means they are never left of
+        # anything
+        return _ends_before_start(self._range, other._range)
 
     def right_of(self, other):
         """
@@ -1082,7 +1303,20 @@ class OffsetableRangeMixin(object):
         lower = None if self.lower is None else self.lower + offset
         upper = None if self.upper is None else self.upper + offset
 
-        return self.replace(lower=lower, upper=upper)
+        # Offsetting a normalized range keeps it normalized, unless rounding
+        # makes the bounds of a float range collapse into a single value
+        if lower is not None and lower == upper:
+            return self.replace(lower=lower, upper=upper)
+
+        return self._from_internal(
+            _internal_range(
+                lower,
+                upper,
+                self._range.lower_inc,
+                self._range.upper_inc,
+                False,
+            )
+        )
 
 
 class intrange(DiscreteRange, OffsetableRangeMixin):
@@ -1104,6 +1338,29 @@ class intrange(DiscreteRange, OffsetableRangeMixin):
     def __len__(self):
         return self.upper - self.lower
 
+    # Iteration is delegated to the builtin range type, which is a lot faster
+    # than stepping through the values using next() and prev()
+
+    def __iter__(self):
+        lower, upper, _, _, empty = self._range
+        if empty:
+            return iter(())
+        elif lower is None:
+            raise TypeError("Range with no lower bound can't be iterated over")
+        elif upper is None:
+            return count(lower)
+        return iter(range(lower, upper))
+
+    def __reversed__(self):
+        lower, upper, _, _, empty = self._range
+        if empty:
+            return iter(())
+        elif upper is None:
+            raise TypeError("Range with no upper bound can't be iterated over")
+        elif lower is None:
+            return count(upper - 1, -1)
+        return reversed(range(lower, upper))
+
 
 class floatrange(Range, OffsetableRangeMixin):
     """
@@ -1193,6 +1450,41 @@ def _is_valid_date(obj, accept_none=True):
     return isinstance(obj, date) and not isinstance(obj, datetime)
 
 
+@lru_cache(maxsize=8192, typed=True)
+def _period_range(day, period):
+    """
+    Return the internal range of the period of the given type that contains the
+    given date. See :meth:`~spans.types.daterange.from_date` for valid periods.
+
+    Results are cached, which means that ranges created for the same period
+    share the same internal range. Since dates of different types are cached
+    separately, date subclasses are kept intact.
+    """
+
+    if period is None or period == "day":
+        start = day
+        end = day + timedelta(1)
+    elif period == "week":
+        start = day - timedelta(day.weekday())
+        end = start + timedelta(7)
+    elif period == "american_week":
+        start = day - timedelta((day.weekday() + 1) % 7)
+        end = start + timedelta(7)
+    elif period == "month":
+        start = day.replace(day=1)
+        end = (start + timedelta(31)).replace(day=1)
+    elif period == "quarter":
+        start = day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+        end = (start + timedelta(93)).replace(day=1)
+    elif period == "year":
+        start = day.replace(month=1, day=1)
+        end = (start + timedelta(366)).replace(day=1)
+    else:
+        raise ValueError("Unexpected period, got {!r}".format(period))
+
+    return _internal_range(start, end, True, False, False)
+
+
 class daterange(DiscreteRange, OffsetableRangeMixin):
     """
     Range that operates on ``datetime.date``.
@@ -1259,27 +1551,19 @@ class daterange(DiscreteRange, OffsetableRangeMixin):
 
         .. versionchanged:: 0.4.0
            Added the period parameter.
+
+        .. versionchanged:: 2.0.0
+           Period boundaries are cached, which makes repeated calls for dates
+           in the same period cheap.
         """
 
-        if period is None or period == "day":
-            return cls(date, date, upper_inc=True)
-        elif period == "week":
-            start = date - timedelta(date.weekday())
-            return cls(start, start + timedelta(7))
-        elif period == "american_week":
-            start = date - timedelta((date.weekday() + 1) % 7)
-            return cls(start, start + timedelta(7))
-        elif period == "month":
-            start = date.replace(day=1)
-            return cls(start, (start + timedelta(31)).replace(day=1))
-        elif period == "quarter":
-            start = date.replace(month=(date.month - 1) // 3 * 3 + 1, day=1)
-            return cls(start, (start + timedelta(93)).replace(day=1))
-        elif period == "year":
-            start = date.replace(month=1, day=1)
-            return cls(start, (start + timedelta(366)).replace(day=1))
-        else:
-            raise ValueError("Unexpected period, got {!r}".format(period))
+        if not _is_valid_date(date, accept_none=False):
+            raise TypeError(
+                f"Invalid type for date '{date.__class__.__name__}'"
+                f" expected '{cls.type.__name__}'"
+            )
+
+        return cls._from_internal(_period_range(date, period))
 
     @classmethod
     def from_week(cls, year, iso_week):
@@ -1378,6 +1662,33 @@ class daterange(DiscreteRange, OffsetableRangeMixin):
 
         return (self.upper - self.lower).days
 
+    # Dates are iterated over as ordinals using the builtin range type, and
+    # converted back to dates in bulk. fromordinal is looked up on the bound
+    # to keep date subclasses intact
+
+    def __iter__(self):
+        lower, upper, _, _, empty = self._range
+        if empty:
+            return iter(())
+        elif lower is None:
+            raise TypeError("Range with no lower bound can't be iterated over")
+        elif upper is None:
+            return map(lower.fromordinal, count(lower.toordinal()))
+        return map(lower.fromordinal, range(lower.toordinal(), upper.toordinal()))
+
+    def __reversed__(self):
+        lower, upper, _, _, empty = self._range
+        if empty:
+            return iter(())
+        elif upper is None:
+            raise TypeError("Range with no upper bound can't be iterated over")
+        elif lower is None:
+            return map(upper.fromordinal, count(upper.toordinal() - 1, -1))
+        return map(
+            upper.fromordinal,
+            reversed(range(lower.toordinal(), upper.toordinal())),
+        )
+
 
 class datetimerange(Range, OffsetableRangeMixin):
     """
@@ -1463,8 +1774,7 @@ class PeriodRange(daterange):
     def from_date(cls, day, period=None):
         span = daterange.from_date(day, period=period)
 
-        new_span = cls()
-        new_span._range = span._range
+        new_span = cls._from_internal(span._range)
         new_span.period = period
 
         return new_span
@@ -1480,12 +1790,7 @@ class PeriodRange(daterange):
         :class:`~spans.types.daterange`.
         """
 
-        return daterange(
-            lower=self.lower,
-            upper=self.upper,
-            lower_inc=self.lower_inc,
-            upper_inc=self.upper_inc,
-        )
+        return daterange._from_internal(self._range)
 
     def offset(self, offset):
         """
@@ -1502,14 +1807,26 @@ class PeriodRange(daterange):
         :return: New offset :class:`~spans.types.PeriodRange`
         """
 
-        span = self
-        if offset > 0:
-            for i in range(offset):
-                span = span.next_period()
-        elif offset < 0:
-            for i in range(-offset):
-                span = span.prev_period()
-        return span
+        if offset == 0:
+            return self
+
+        # The target period is computed directly from the start of this period
+        # instead of stepping through every period in between
+        period = self.period
+        start = self.lower
+        if period is None or period == "day":
+            return self.from_date(start + timedelta(offset), period=period)
+        elif period == "week" or period == "american_week":
+            return self.from_date(start + timedelta(7 * offset), period=period)
+        elif period == "month":
+            months = offset
+        elif period == "quarter":
+            months = 3 * offset
+        else:
+            months = 12 * offset
+
+        year, month = divmod(start.year * 12 + start.month - 1 + months, 12)
+        return self.from_date(date(year, month + 1, 1), period=period)
 
     def prev_period(self):
         """
@@ -1553,6 +1870,12 @@ class PeriodRange(daterange):
     def difference(self, other):
         return self.daterange.difference(other)
 
+    def _replace_lower(self, lower, lower_inc):
+        return self.daterange._replace_lower(lower, lower_inc)
+
+    def _replace_upper(self, upper, upper_inc):
+        return self.daterange._replace_upper(upper, upper_inc)
+
 
 # Legacy names
 
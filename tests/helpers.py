@@ -0,0 +1,19 @@
+import itertools
+
+
+def all_ranges(range_type, values):
+    """
+    Return every distinct non-empty range of the given type that can be built
+    from the given bounds, including unbounded ones, with every combination of
+    inclusive and exclusive bounds.
+    """
+
+    ranges = [
+        range_type(lower, upper, lower_inc, upper_inc)
+        for lower, upper in itertools.product([None] + values, repeat=2)
+        for lower_inc, upper_inc in itertools.product([False, True], repeat=2)
+        if not (lower is None and lower_inc)
+        and not (upper is None and upper_inc)
+        and (lower is None or upper is None or lower <= upper)
+    ]
+    return list(dict.fromkeys(r for r in ranges if r))
@@ -0,0 +1,366 @@
+import itertools
+import random
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from helpers import all_ranges
+
+from spans import (
+    daterange,
+    datetimerange,
+    datetimerangeset,
+    floatrange,
+    floatrangeset,
+    intrange,
+    intrangeset,
+)
+
+np = pytest.importorskip("numpy")
+
+from spans.arrays import (
+    daterangearray,
+    datetimerangearray,
+    floatrangearray,
+    intrangearray,
+)
+
+
+def all_ranges_and_empty(range_type, values):
+    return all_ranges(range_type, values) + [range_type.empty()]
+
+
+def all_pairs(array_type, values):
+    ranges = all_ranges_and_empty(array_type.type, values)
+    pairs = list(itertools.product(ranges, repeat=2))
+    a = array_type([a for a, _ in pairs])
+    b = array_type([b for _, b in pairs])
+    return pairs, a, b
+
+
+range_arrays = pytest.mark.parametrize(
+    "array_type, values",
+    [
+        (intrangearray, [1, 2, 3]),
+        (floatrangearray, [1.0, 2.0, 3.0]),
+        (daterangearray, [date(2000, 1, 1), date(2000, 1, 2), date(2000, 1, 3)]),
+        (
+            datetimerangearray,
+            [datetime(2000, 1, 1), datetime(2000, 1, 1, 12), datetime(2000, 1, 2)],
+        ),
+    ],
+)
+
+
+@range_arrays
+def test_round_trip(array_type, values):
+    ranges = all_ranges_and_empty(array_type.type, values)
+    array = array_type(ranges)
+
+    assert len(array) == len(ranges)
+    assert list(array) == ranges
+    assert [r._range for r in array] == [r._range for r in ranges]
+    assert array[0] == ranges[0]
+    assert array[-1] == ranges[-1]
+    assert list(array[1:3]) == ranges[1:3]
+
+
+@range_arrays
+@pytest.mark.parametrize(
+    "op",
+    ["contains", "overlap", "adjacent", "left_of", "right_of"],
+)
+def test_predicates(array_type, values, op):
+    pairs, a, b = all_pairs(array_type, values)
+
+    result = getattr(a, op)(b)
+    assert result.tolist() == [getattr(x, op)(y) for x, y in pairs]
+
+
+@range_arrays
+def test_predicates_broadcast(array_type, values):
+    ranges = all_ranges_and_empty(array_type.type, values)
+    array = array_type(ranges)
+    other = array_type.type(values[0], values[-1])
+
+    assert array.overlap(other).tolist() == [r.overlap(other) for r in ranges]
+    assert array.contains(other).tolist() == [r.contains(other) for r in ranges]
+
+
+@range_arrays
+def test_contains_scalars(array_type, values):
+    ranges = all_ranges_and_empty(array_type.type, values)
+    array = array_type(ranges)
+
+    for value in values:
+        # Empty ranges contain no scalars
+        expected = [bool(r) and r.contains(value) for r in ranges]
+        assert array.contains(value).tolist() == expected
+
+    scalars = array_type([array_type.type(values[1], values[1], upper_inc=True)])
+    assert scalars.contains(values).tolist() == [False, True, False]
+
+
+@range_arrays
+def test_intersection(array_type, values):
+    pairs, a, b = all_pairs(array_type, values)
+
+    assert list(a.intersection(b)) == [x.intersection(y) for x, y in pairs]
+
+
+@range_arrays
+def test_union(array_type, values):
+    pairs, a, b = all_pairs(array_type, values)
+
+    mergeable = [not x or not y or x.overlap(y) or x.adjacent(y) for x, y in pairs]
+    pairs = [pair for pair, keep in zip(pairs, mergeable) if keep]
+
+    result = a[np.array(mergeable)].union(b[np.array(mergeable)])
+    assert [r._range for r in result] == [x.union(y)._range for x, y in pairs]
+
+    with pytest.raises(ValueError):
+        a.union(b)
+
+
+def test_contains_numpy_array():
+    array = intrangearray([intrange(1, 5)])
+    assert array.contains(np.arange(7)).tolist() == [
+        False,
+        True,
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
+
+    with pytest.raises(TypeError):
+        array.contains(np.arange(7.0))
+
+
+def test_contains_many_finer_datetime_unit():
+    # Nanoseconds must be compared exactly, not rounded to the microseconds of
+    # the bounds
+    rset = datetimerangeset(
+        [
+            datetimerange(datetime(2000, 1, 1), datetime(2000, 1, 2), lower_inc=False),
+            datetimerange(datetime(1900, 1, 1), datetime(1900, 1, 2), upper_inc=True),
+            datetimerange(datetime(3000, 1, 1)),
+        ]
+    )
+    values = np.array(
+        [
+            "2000-01-01T00:00:00",
+            "2000-01-01T00:00:00.000000001",
+            "2000-01-01T23:59:59.999999999",
+            "2000-01-02T00:00:00",
+            "1900-01-01T00:00:00",
+            "1900-01-02T00:00:00",
+            "1900-01-02T00:00:00.000000001",
+            "1899-12-31T23:59:59.999999999",
+            "2200-01-01T00:00:00",
+            "NaT",
+        ],
+        dtype="datetime64[ns]",
+    )
+    expected = [False, True, True, False, True, True, False, False, False, False]
+
+    assert rset.contains_many(values).tolist() == expected
+    array = datetimerangearray(list(rset))
+    assert [array.contains(value).any() for value in values] == expected
+
+
+def test_contains_many_unsigned():
+    rset = intrangeset([intrange(1, 5), intrange(2**63 - 1)])
+    values = np.array(
+        [0, 1, 5, 2**63 - 2, 2**63 - 1, 2**63, 2**64 - 1], dtype="uint64"
+    )
+
+    assert rset.contains_many(values).tolist() == [
+        rset.contains(int(value)) for value in values
+    ]
+    assert rset.contains_many(values.astype("uint8")).tolist()[:3] == [
+        False,
+        True,
+        False,
+    ]
+
+    rset = intrangeset([intrange(1, 5)])
+    assert rset.contains_many(values).tolist() == [
+        False,
+        True,
+        False,
+        False,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_type_checks():
+    with pytest.raises(TypeError):
+        intrangearray([floatrange(1.0, 5.0)])
+
+    with pytest.raises(TypeError):
+        intrangearray([intrange(1, 5)]).overlap(floatrange(1.0, 5.0))
+
+    with pytest.raises(TypeError):
+        intrangearray([intrange(1, 5)]).overlap(floatrangearray([]))
+
+    with pytest.raises(TypeError):
+        intrangearray([intrange(1, 5)]).contains(1.0)
+
+    with pytest.raises(TypeError):
+        daterangearray([daterange(date(2000, 1, 1))]).contains(datetime(2000, 1, 1))
+
+
+def test_timezone_aware_datetimes():
+    aware = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    with pytest.raises(ValueError):
+        datetimerangearray([datetimerange(aware, aware + timedelta(1))])
+
+
+def test_repr():
+    assert repr(intrangearray([intrange(1, 5), intrange.empty()])) == (
+        "intrangearray([intrange(1, 5), intrange.empty()])"
+    )
+
+
+@range_arrays
+def test_from_arrays(array_type, values):
+    ranges = all_ranges(array_type.type, values)
+    lower = [r.lower for r in ranges]
+    upper = [r.upper for r in ranges]
+    lower_inc = [r.lower_inc for r in ranges]
+    upper_inc = [r.upper_inc for r in ranges]
+
+    array = array_type.from_arrays(lower, upper, lower_inc, upper_inc)
+    assert [r._range for r in array] == [r._range for r in ranges]
+
+
+def test_from_arrays_numpy():
+    lower = np.array(["2000-01-01", "NaT", "2000-01-03"], dtype="datetime64[D]")
+    upper = np.array(["2000-01-02", "2000-01-01", "NaT"], dtype="datetime64[D]")
+
+    assert list(daterangearray.from_arrays(lower, upper)) == [
+        daterange(date(2000, 1, 1), date(2000, 1, 2)),
+        daterange(upper=date(2000, 1, 1)),
+        daterange(date(2000, 1, 3)),
+    ]
+    assert list(datetimerangearray.from_arrays(lower, upper))[0] == datetimerange(
+        datetime(2000, 1, 1), datetime(2000, 1, 2)
+    )
+
+    with pytest.raises(TypeError):
+        intrangearray.from_arrays(np.arange(3.0), np.arange(3.0))
+
+
+@pytest.mark.parametrize(
+    "array_type, unit",
+    [
+        (daterangearray, "s"),
+        (daterangearray, "us"),
+        (daterangearray, "ns"),
+        (datetimerangearray, "ns"),
+    ],
+)
+def test_from_arrays_finer_unit(array_type, unit):
+    # Finer units are accepted as long as no precision is lost
+    lower = np.array(["2000-01-01", "NaT"], dtype="datetime64[D]")
+    upper = np.array(["2000-01-02", "2000-01-01"], dtype="datetime64[D]")
+    expected = array_type.from_arrays(lower, upper)
+
+    array = array_type.from_arrays(
+        lower.astype(f"datetime64[{unit}]"), upper.astype(f"datetime64[{unit}]")
+    )
+    assert list(array) == list(expected)
+
+    with pytest.raises(ValueError):
+        array_type.from_arrays(
+            lower.astype(f"datetime64[{unit}]") + np.timedelta64(1, unit),
+            upper.astype(f"datetime64[{unit}]"),
+        )
+
+
+def test_from_arrays_default_flags():
+    array = intrangearray.from_arrays(
+        [1, 10, None], [3, 14, 20], [None, False, None], [True, None, None]
+    )
+    assert list(array) == [intrange(1, 4), intrange(11, 14), intrange(upper=20)]
+
+    array = floatrangearray.from_arrays(
+        np.array([1.0, 2.0]), np.array([3.0, 4.0]), np.array([None, False])
+    )
+    assert list(array) == [
+        floatrange(1.0, 3.0),
+        floatrange(2.0, 4.0, lower_inc=False),
+    ]
+
+
+@pytest.mark.parametrize(
+    "array_type, lower, upper, lower_inc, upper_inc",
+    [
+        (intrangearray, [2**63 - 2], [2**63 - 1], None, True),
+        (intrangearray, [2**63 - 1], [2**63 - 1], False, None),
+        (daterangearray, [date(9999, 12, 30)], [date.max], None, True),
+        (daterangearray, [date.max], [date.max], False, None),
+    ],
+)
+def test_from_arrays_overflow(array_type, lower, upper, lower_inc, upper_inc):
+    with pytest.raises(OverflowError):
+        array_type.from_arrays(lower, upper, lower_inc, upper_inc)
+
+    with pytest.raises(OverflowError):
+        array_type.from_arrays(
+            np.array(lower, dtype=array_type.dtype),
+            np.array(upper, dtype=array_type.dtype),
+            lower_inc,
+            upper_inc,
+        )
+
+
+def test_from_arrays_unsigned():
+    array = intrangearray.from_arrays(
+        np.array([1, 5], dtype="uint64"), np.array([3, 2**63 - 1], dtype="uint64")
+    )
+    assert list(array) == [intrange(1, 3), intrange(5, 2**63 - 1)]
+
+    with pytest.raises(OverflowError):
+        intrangearray.from_arrays(
+            np.array([1], dtype="uint64"), np.array([2**63], dtype="uint64")
+        )
+
+
+@pytest.mark.parametrize(
+    "rset_type, array_type, conv",
+    [(intrangeset, intrangearray, int), (floatrangeset, floatrangearray, float)],
+)
+def test_from_arrays_rangeset(rset_type, array_type, conv):
+    # Compare against the constructor using random ranges with every kind of
+    # bound
+    rnd = random.Random(0)
+    for _ in range(200):
+        count = rnd.randint(0, 20)
+        lower = [conv(rnd.randint(0, 30)) for _ in range(count)]
+        upper = [value + conv(rnd.randint(0, 10)) for value in lower]
+        lower_inc = [rnd.random() < 0.5 for _ in range(count)]
+        upper_inc = [rnd.random() < 0.5 for _ in range(count)]
+        for i in range(count):
+            if rnd.random() < 0.1:
+                lower[i] = None
+                lower_inc[i] = False
+            elif rnd.random() < 0.1:
+                upper[i] = None
+                upper_inc[i] = False
+
+        expected = rset_type(map(rset_type.type, lower, upper, lower_inc, upper_inc))
+        rset = rset_type.from_arrays(lower, upper, lower_inc, upper_inc)
+        assert [r._range for r in rset] == [r._range for r in expected]
+
+        if None not in lower and None not in upper:
+            rset = rset_type.from_arrays(
+                np.array(lower, dtype=array_type.dtype),
+                np.array(upper, dtype=array_type.dtype),
+                np.array(lower_inc),
+                upper_inc,
+            )
+            assert rset == expected
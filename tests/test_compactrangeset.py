@@ -0,0 +1,205 @@
+import operator
+import pickle
+import random
+
+import pytest
+
+from spans import (
+    compactfloatrangeset,
+    compactintrangeset,
+    floatrange,
+    floatrangeset,
+    intrange,
+    intrangeset,
+)
+from spans._compact import CompactRangeList
+
+
+def random_ranges(rnd, range_type, conv):
+    ranges = []
+    for _ in range(rnd.randint(0, 8)):
+        lower = conv(rnd.randint(0, 30))
+        upper = lower + conv(rnd.randint(0, 10))
+        lower_inc = rnd.random() < 0.5
+        upper_inc = rnd.random() < 0.5
+        if rnd.random() < 0.1:
+            lower = None
+            lower_inc = False
+        elif rnd.random() < 0.1:
+            upper = None
+            upper_inc = False
+        ranges.append(range_type(lower, upper, lower_inc, upper_inc))
+    return ranges
+
+
+set_types = pytest.mark.parametrize(
+    "compact_type, rset_type, conv",
+    [
+        (compactintrangeset, intrangeset, int),
+        (compactfloatrangeset, floatrangeset, float),
+    ],
+)
+
+
+@set_types
+def test_matches_rangeset(compact_type, rset_type, conv):
+    # Every operation must give the exact same result as a regular range set
+    rnd = random.Random(0)
+    range_type = rset_type.type
+    for _ in range(200):
+        a = random_ranges(rnd, range_type, conv)
+        b = random_ranges(rnd, range_type, conv)
+
+        compact = compact_type(a)
+        rset = rset_type(a)
+        other = rset_type(b)
+
+        assert isinstance(compact._list, CompactRangeList)
+        assert [r._range for r in compact] == [r._range for r in rset]
+        assert list(reversed(compact._list)) == list(reversed(rset._list))
+        assert compact == rset
+        assert repr(compact) == repr(rset).replace(
+            rset_type.__name__, compact_type.__name__
+        )
+        assert len(compact) == len(rset)
+        assert compact.span() == rset.span()
+        assert ~compact == ~rset
+
+        for op in [
+            operator.eq,
+            operator.ne,
+            operator.lt,
+            operator.le,
+            operator.gt,
+            operator.ge,
+        ]:
+            assert op(compact, compact_type(b)) == op(rset, other)
+            assert op(compact, other) == op(rset, other)
+
+        for method in ["union", "intersection", "difference", "symmetric_difference"]:
+            result = getattr(compact, method)(other)
+            assert type(result) is compact_type
+            assert result == getattr(rset, method)(other)
+
+        for r in b:
+            assert compact.contains(r) == rset.contains(r)
+        for value in range(-1, 42):
+            assert compact.contains(conv(value)) == rset.contains(conv(value))
+
+        try:
+            assert compact.measure() == rset.measure()
+        except ValueError:
+            with pytest.raises(ValueError):
+                rset.measure()
+
+        for r in b:
+            compact.add(r)
+            rset.add(r)
+            assert compact == rset
+        for r in a:
+            compact.remove(r)
+            rset.remove(r)
+            assert compact == rset
+
+        assert isinstance(compact._list, CompactRangeList)
+
+
+@set_types
+def test_from_arrays(compact_type, rset_type, conv):
+    rnd = random.Random(0)
+    range_type = rset_type.type
+    for _ in range(50):
+        ranges = [r for r in random_ranges(rnd, range_type, conv) if r]
+        columns = (
+            [r.lower for r in ranges],
+            [r.upper for r in ranges],
+            [r.lower_inc for r in ranges],
+            [r.upper_inc for r in ranges],
+        )
+
+        rset = compact_type.from_arrays(*columns)
+        assert isinstance(rset._list, CompactRangeList)
+        assert [r._range for r in rset] == [
+            r._range for r in rset_type.from_arrays(*columns)
+        ]
+
+
+@set_types
+def test_in_place_operations(compact_type, rset_type, conv):
+    range_type = rset_type.type
+    rset = compact_type([range_type(conv(1), conv(10))])
+    original = rset
+
+    rset |= rset_type([range_type(conv(20), conv(30))])
+    rset &= rset_type([range_type(conv(5), conv(25))])
+    rset -= rset_type([range_type(conv(6), conv(7))])
+    rset ^= rset_type([range_type(conv(0), conv(6))])
+
+    assert rset is original
+    assert isinstance(rset._list, CompactRangeList)
+    assert rset == rset_type(
+        [
+            range_type(conv(0), conv(5)),
+            range_type(conv(7), conv(10)),
+            range_type(conv(20), conv(25)),
+        ]
+    )
+
+
+def test_copy():
+    rset = compactintrangeset([intrange(1, 5)])
+    rcopy = rset.copy()
+    rcopy.add(intrange(10, 15))
+
+    assert rset == intrangeset([intrange(1, 5)])
+    assert rcopy == intrangeset([intrange(1, 5), intrange(10, 15)])
+    assert type(rset.union()) is compactintrangeset
+    assert rset.union()._list is not rset._list
+
+
+def test_values():
+    rset = compactintrangeset([intrange(1, 3), intrange(5, 7)])
+    assert list(rset.values()) == [1, 2, 5, 6]
+
+
+@pytest.mark.parametrize(
+    "rset",
+    [
+        compactintrangeset([]),
+        compactintrangeset([intrange(upper=-5), intrange(1, 10), intrange(20)]),
+        compactfloatrangeset([floatrange(0.5, 1.5, upper_inc=True)]),
+    ],
+)
+def test_pickling(rset):
+    loaded = pickle.loads(pickle.dumps(rset))
+
+    assert loaded == rset
+    assert isinstance(loaded._list, CompactRangeList)
+
+
+def test_overflow():
+    with pytest.raises(OverflowError):
+        compactintrangeset([intrange(0, 2**63)])
+
+    rset = compactintrangeset([intrange(-(2**63), 2**63 - 1)])
+    assert rset.measure() == 2**64 - 1
+
+
+def test_contains_many():
+    np = pytest.importorskip("numpy")
+
+    rset = compactintrangeset([intrange(upper=0), intrange(5, 10)])
+    assert rset.contains_many(np.arange(-1, 12)).tolist() == [
+        x < 0 or 5 <= x < 10 for x in range(-1, 12)
+    ]
+
+    rset = compactfloatrangeset([floatrange(1.0, 2.0, upper_inc=True)])
+    assert rset.contains_many([1.0, 2.0, 3.0]).tolist() == [True, True, False]
+
+
+@pytest.mark.parametrize("cls", [compactintrangeset, compactfloatrangeset])
+def test_slots_in_cls_hierarchy(cls):
+    for c in cls.mro():
+        if c is object:
+            continue
+        assert hasattr(c, "__slots__")
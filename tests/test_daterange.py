@@ -3,6 +3,7 @@ from datetime import date, datetime, timedelta
 import pytest
 
 from spans import daterange
+from spans.types import DiscreteRange
 
 
 def test_datetime_type_check():
@@ -29,6 +30,14 @@ def test_from_date():
     )
 
 
+def test_from_date_shares_internal_range():
+    a = daterange.from_date(date(2000, 1, 1), period="month")
+    b = daterange.from_date(date(2000, 1, 1), period="month")
+
+    assert a == b
+    assert a._range is b._range
+
+
 @pytest.mark.parametrize(
     "day, span",
     [
@@ -108,17 +117,20 @@ def test_from_date_year(day, span):
 
 
 @pytest.mark.parametrize(
-    "param",
+    "param, period",
     [
-        True,
-        1,
-        1.0,
-        datetime(2000, 1, 1),
+        (True, None),
+        (1, None),
+        (1.0, None),
+        (datetime(2000, 1, 1), None),
+        (datetime(2000, 1, 1), "month"),
+        (None, "month"),
+        ("2000-01-01", "month"),
     ],
 )
-def test_from_date_type_check(param):
+def test_from_date_type_check(param, period):
     with pytest.raises(TypeError):
-        daterange.from_date(param)
+        daterange.from_date(param, period=period)
 
 
 @pytest.mark.parametrize(
@@ -127,6 +139,7 @@ def test_from_date_type_check(param):
         "Year",
         "YEAR",
         "foobar",
+        "decade",
     ],
 )
 def test_from_date_period_check(period):
@@ -202,6 +215,43 @@ def test_last():
     assert span.last == date(2000, 1, 31)
 
 
+@pytest.mark.parametrize(
+    "span",
+    [
+        daterange(date(2000, 1, 1), date(2000, 1, 8)),
+        daterange(date(1999, 12, 30), date(2000, 3, 2), upper_inc=True),
+        daterange(date(2000, 1, 1), date(2000, 1, 2)),
+    ],
+)
+def test_iter_matches_generic(span):
+    assert list(span) == list(DiscreteRange.__iter__(span))
+    assert list(reversed(span)) == list(DiscreteRange.__reversed__(span))
+    assert len(list(span)) == len(span)
+
+
+def test_iter_unbounded():
+    days = iter(daterange(date(2000, 2, 28)))
+    assert [next(days) for _ in range(3)] == [
+        date(2000, 2, 28),
+        date(2000, 2, 29),
+        date(2000, 3, 1),
+    ]
+
+    days = reversed(daterange(upper=date(2000, 3, 1)))
+    assert [next(days) for _ in range(2)] == [date(2000, 2, 29), date(2000, 2, 28)]
+
+    with pytest.raises(TypeError):
+        iter(daterange(upper=date(2000, 1, 1)))
+
+    with pytest.raises(TypeError):
+        reversed(daterange(date(2000, 1, 1)))
+
+
+def test_iter_empty():
+    assert list(daterange.empty()) == []
+    assert list(reversed(daterange.empty())) == []
+
+
 def test_len_on_unbounded():
     with pytest.raises(ValueError):
         len(daterange())
@@ -222,3 +272,10 @@ def test_bug5_date_subclassing():
         pass
 
     daterange(DateSubClass(2000, 1, 1))
+
+    span = daterange(DateSubClass(2000, 1, 1), DateSubClass(2000, 1, 3))
+    assert all(isinstance(day, DateSubClass) for day in span)
+
+    month = daterange.from_date(DateSubClass(2000, 1, 1), period="month")
+    assert isinstance(month.lower, DateSubClass)
+    assert all(isinstance(day, DateSubClass) for day in reversed(span))
@@ -3,6 +3,7 @@ from datetime import date, timedelta
 import pytest
 
 from spans import daterange, intrange
+from spans.types import DiscreteRange
 
 
 def test_last():
@@ -33,3 +34,21 @@ def test_reversed():
 def test_no_lower_upper_reversed():
     with pytest.raises(TypeError):
         next(reversed(intrange(1)))
+
+
+@pytest.mark.parametrize(
+    "span",
+    [
+        intrange(0, 5),
+        intrange(-3, 4, upper_inc=True),
+        intrange(2, 3),
+    ],
+)
+def test_iter_matches_generic(span):
+    assert list(span) == list(DiscreteRange.__iter__(span))
+    assert list(reversed(span)) == list(DiscreteRange.__reversed__(span))
+
+
+def test_iter_empty():
+    assert list(intrange.empty()) == []
+    assert list(reversed(intrange.empty())) == []
@@ -0,0 +1,109 @@
+import pickle
+
+import pytest
+
+from spans import (
+    frozendaterangeset,
+    frozendatetimerangeset,
+    frozenfloatrangeset,
+    frozenintrangeset,
+    frozenstrrangeset,
+    frozentimedeltarangeset,
+    intrange,
+    intrangeset,
+)
+
+
+def test_hash():
+    a = frozenintrangeset([intrange(1, 5), intrange(10, 15)])
+    b = frozenintrangeset([intrange(10, 15), intrange(1, 5)])
+
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+    assert {a: 1}[b] == 1
+
+
+def test_immutable():
+    rset = frozenintrangeset([intrange(1, 5)])
+
+    for method in [
+        "add",
+        "remove",
+        "update",
+        "difference_update",
+        "intersection_update",
+        "symmetric_difference_update",
+    ]:
+        with pytest.raises(TypeError):
+            getattr(rset, method)(intrange(1, 2))
+
+    assert list(rset) == [intrange(1, 5)]
+
+
+def test_in_place_operators_return_new_set():
+    rset = frozenintrangeset([intrange(1, 5)])
+    original = rset
+
+    rset |= intrangeset([intrange(5, 10)])
+
+    assert rset is not original
+    assert isinstance(rset, frozenintrangeset)
+    assert rset == frozenintrangeset([intrange(1, 10)])
+    assert original == frozenintrangeset([intrange(1, 5)])
+
+
+def test_mixed_operations():
+    frozen = frozenintrangeset([intrange(1, 10)])
+    mutable = intrangeset([intrange(5, 15)])
+
+    assert frozen == intrangeset([intrange(1, 10)])
+    assert intrangeset([intrange(1, 10)]) == frozen
+
+    assert type(frozen | mutable) is frozenintrangeset
+    assert type(mutable | frozen) is intrangeset
+    assert frozen & mutable == intrangeset([intrange(5, 10)])
+    assert frozen - mutable == intrangeset([intrange(1, 5)])
+
+    mutable.update(frozen)
+    assert mutable == intrangeset([intrange(1, 15)])
+
+
+def test_cached_values():
+    rset = frozenintrangeset([intrange(1, 5), intrange(10, 15)])
+
+    assert rset.span() is rset.span()
+    assert ~rset is ~rset
+    assert ~~rset is rset
+    assert ~rset == frozenintrangeset(
+        [intrange(upper=1), intrange(5, 10), intrange(15)]
+    )
+    assert rset.copy() is rset
+    assert rset.union() is rset
+
+
+def test_pickling():
+    rset = frozenintrangeset([intrange(1, 10), intrange(20, 30)])
+    loaded = pickle.loads(pickle.dumps(rset))
+
+    assert rset == loaded
+    assert hash(rset) == hash(loaded)
+    assert isinstance(loaded._list, tuple)
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [
+        frozendaterangeset,
+        frozendatetimerangeset,
+        frozenintrangeset,
+        frozenfloatrangeset,
+        frozenstrrangeset,
+        frozentimedeltarangeset,
+    ],
+)
+def test_slots_in_cls_hierarchy(cls):
+    for c in cls.mro():
+        if c is object:
+            continue
+        assert hasattr(c, "__slots__")
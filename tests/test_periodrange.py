@@ -137,3 +137,21 @@ def test_offset(a, offset, b):
 def test_zero_offset():
     period = PeriodRange.from_week(2000, 1)
     assert period.offset(0) is period
+
+
+@pytest.mark.parametrize(
+    "period",
+    [None, "day", "week", "american_week", "month", "quarter", "year"],
+)
+@pytest.mark.parametrize("offset", [1, 2, 5, 13, 53])
+def test_offset_matches_stepping(period, offset):
+    span = PeriodRange.from_date(date(2000, 11, 30), period=period)
+
+    forward = backward = span
+    for _ in range(offset):
+        forward = forward.next_period()
+        backward = backward.prev_period()
+
+    assert span.offset(offset) == forward
+    assert span.offset(offset).period == period
+    assert span.offset(-offset) == backward
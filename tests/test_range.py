@@ -1,8 +1,10 @@
 import itertools
 import operator
 import pickle
+from datetime import date, datetime
 
 import pytest
+from helpers import all_ranges
 
 from spans import (
     PeriodRange,
@@ -13,7 +15,13 @@ from spans import (
     strrange,
     timedeltarange,
 )
-from spans.types import _Bound
+from spans.types import (
+    _Bound,
+    _cmp_lower,
+    _cmp_upper,
+    _ends_before_start,
+    _touches,
+)
 
 
 def test_empty():
@@ -47,6 +55,58 @@ def test_bound_helper():
     assert _Bound(1, inc=True, is_lower=True) < _Bound(1, inc=False, is_lower=True)
 
 
+@pytest.mark.parametrize(
+    "range_type, values",
+    [
+        (floatrange, [1.0, 2.0]),
+        (intrange, [1, 2]),
+    ],
+)
+def test_bound_comparison_helpers(range_type, values):
+    # The allocation free helpers must agree with _Bound for every combination
+    # of bounds
+    ranges = all_ranges(range_type, values)
+
+    def sign(value):
+        return (value > 0) - (value < 0)
+
+    def cmp(a, b):
+        return (a > b) - (a < b)
+
+    for a, b in itertools.product(ranges, repeat=2):
+        assert sign(_cmp_lower(a._range, b._range)) == cmp(
+            a._lower_bound, b._lower_bound
+        )
+        assert sign(_cmp_upper(a._range, b._range)) == cmp(
+            a._upper_bound, b._upper_bound
+        )
+        assert _ends_before_start(a._range, b._range) == (
+            a._upper_bound < b._lower_bound
+        )
+        assert _touches(a._range, b._range) == a._upper_bound.adjacent(b._lower_bound)
+
+
+@pytest.mark.parametrize(
+    "range_type, values",
+    [
+        (floatrange, [1.0, 2.0]),
+        (intrange, [1, 2]),
+        (datetimerange, [datetime(2000, 1, 1), datetime(2000, 1, 2)]),
+    ],
+)
+def test_sort_key(range_type, values):
+    ranges = all_ranges(range_type, values)
+
+    for a, b in itertools.product(ranges, repeat=2):
+        assert (a.sort_key() < b.sort_key()) == (a < b)
+        assert (a.sort_key() == b.sort_key()) == (a == b)
+
+    # Empty ranges are placed first
+    assert sorted(ranges + [range_type.empty()], key=range_type.sort_key) == [
+        range_type.empty()
+    ] + sorted(ranges)
+
+
 @pytest.mark.parametrize(
     "range_type, lower, upper, lower_inc, upper_inc, exc_type",
     [
@@ -105,6 +165,30 @@ def test_replace():
     assert not rebounded_span.lower_inc
 
 
+@pytest.mark.parametrize(
+    "span, kwargs, expected",
+    [
+        (intrange.empty(), dict(upper=5), intrange(upper=5)),
+        (intrange(upper=5), dict(upper=10), intrange(upper=10)),
+        (intrange(1, 5), dict(lower=None), intrange(upper=5)),
+        (intrange(1, 5), dict(upper=None), intrange(1)),
+        (intrange(1, 5), dict(upper_inc=True), intrange(1, 6)),
+        (floatrange(1.0, 5.0), dict(lower=5.0), floatrange.empty()),
+        (floatrange(1.0), dict(upper=5.0), floatrange(1.0, 5.0)),
+    ],
+)
+def test_replace_keeps_other_bounds(span, kwargs, expected):
+    assert span.replace(**kwargs) == expected
+
+
+def test_replace_invalid():
+    with pytest.raises(ValueError):
+        floatrange(1.0, 5.0, upper_inc=True).replace(upper=None)
+
+    with pytest.raises(TypeError):
+        intrange(1, 5).replace(step=2)
+
+
 def test_unbounded():
     range = intrange()
 
@@ -225,6 +309,7 @@ def test_less_equal(a, b):
 def test_empty_comparison(a, b):
     assert not a < b
     assert not a > b
+    assert (a <= b) == (a >= b) == (a == b)
 
 
 @pytest.mark.parametrize(
@@ -714,11 +799,66 @@ def test_intersection_typecheck():
         a & b
 
 
+@pytest.mark.parametrize(
+    "result, expected",
+    [
+        (intrange(upper=5).union(intrange(3, 10)), intrange(upper=10)),
+        (intrange(upper=5).intersection(intrange(upper=3)), intrange(upper=3)),
+        (intrange(upper=5).difference(intrange(3)), intrange(upper=3)),
+        (intrange(1).difference(intrange(upper=3)), intrange(3)),
+        (intrange(upper=5).offset(5), intrange(upper=10)),
+        (floatrange(upper=5.0).union(floatrange(3.0)), floatrange()),
+        (
+            floatrange(1.0, 5.0).difference(floatrange(3.0, 5.0)),
+            floatrange(1.0, 3.0),
+        ),
+        (
+            floatrange(upper=5.0).offset(1.0),
+            floatrange(upper=6.0),
+        ),
+    ],
+)
+def test_derived_ranges_normalized(result, expected):
+    # Derived ranges bypass the constructor, which means they must end up with
+    # the exact same internal representation as a constructed range
+    assert type(result) is type(expected)
+    assert result._range == expected._range
+
+
 def test_pickling():
     span = intrange(1, 10)
     assert span == pickle.loads(pickle.dumps(span))
 
 
+def test_pickling_skips_cached_hash():
+    span = strrange("a", "z")
+    hash(span)
+
+    assert "_hash" not in span.__getstate__()
+    assert hash(pickle.loads(pickle.dumps(span))) == hash(span)
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        (intrange(1, 5), intrange(1, 5)),
+        (intrange(1, 5), intrange(0, 4, lower_inc=False, upper_inc=True)),
+        (intrange.empty(), intrange(1, 1)),
+        (floatrange(), floatrange()),
+        (daterange(date(2000, 1, 1)), daterange(date(2000, 1, 1))),
+        (
+            daterange(date(2000, 1, 1), date(2000, 2, 1)),
+            PeriodRange.from_date(date(2000, 1, 1), period="month"),
+        ),
+    ],
+)
+def test_hash(a, b):
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+    assert {a: True}[b]
+
+
 def test_bug7_overlap_empty():
     assert not intrange(1, 10).overlap(intrange.empty())
 
@@ -1,15 +1,27 @@
+import itertools
 import pickle
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 
 from spans import (
+    PeriodRange,
+    compactintrangeset,
+    daterange,
     daterangeset,
+    datetimerange,
     datetimerangeset,
     floatrange,
     floatrangeset,
+    frozendaterangeset,
+    frozendatetimerangeset,
+    frozenfloatrangeset,
+    frozenintrangeset,
     intrange,
     intrangeset,
+    strrange,
     strrangeset,
+    timedeltarange,
     timedeltarangeset,
 )
 
@@ -33,6 +45,28 @@ def test_span(rangeset, span):
     assert rangeset.span() == span
 
 
+@pytest.mark.parametrize("presorted", [True, False])
+def test_from_ranges(presorted):
+    ranges = [
+        intrange(upper=0),
+        intrange(1, 5),
+        intrange(3, 8),
+        intrange.empty(),
+        intrange(8, 10),
+        intrange(12, 15),
+        intrange(13, 14),
+        intrange(20),
+    ]
+    expected = [intrange(upper=0), intrange(1, 10), intrange(12, 15), intrange(20)]
+
+    assert list(intrangeset.from_ranges(ranges, presorted=presorted)) == expected
+    assert list(intrangeset.from_ranges(reversed(ranges))) == expected
+    assert intrangeset.from_ranges(ranges) == intrangeset(ranges)
+
+    with pytest.raises(TypeError):
+        intrangeset.from_ranges([intrange(1, 5), floatrange(1.0)])
+
+
 def test_iteration():
     ranges = [intrange(1, 5), intrange(10, 15)]
     assert list(intrangeset(ranges)) == ranges
@@ -71,6 +105,240 @@ def test_not_contains(value):
     assert not intrangeset([intrange(1, 10)]).contains(value)
 
 
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (0, False),
+        (1, True),
+        (5, False),
+        (10, True),
+        (14, True),
+        (15, False),
+        (100, True),
+        (intrange(2, 4), True),
+        (intrange(4, 11), False),
+        (intrange(10, 15), True),
+        (intrange(20, 30), True),
+        (intrange(upper=1), False),
+    ],
+)
+def test_contains_multiple(value, expected):
+    rset = intrangeset([intrange(1, 5), intrange(10, 15), intrange(20)])
+    assert rset.contains(value) is expected
+
+
+@pytest.mark.parametrize(
+    "rset, values",
+    [
+        (intrangeset([]), [0, 1]),
+        (
+            intrangeset([intrange(upper=-5), intrange(1, 5), intrange(10)]),
+            list(range(-10, 15)),
+        ),
+        (
+            floatrangeset(
+                [
+                    floatrange(upper=0.0, upper_inc=True),
+                    floatrange(1.0, 2.0, lower_inc=False),
+                    floatrange(3.0, 4.0, upper_inc=True),
+                ]
+            ),
+            [-1.0, 0.0, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 4.5, float("nan")],
+        ),
+        (
+            daterangeset([daterange(date(2000, 1, 1), date(2000, 2, 1))]),
+            [date(1999, 12, 31), date(2000, 1, 1), date(2000, 2, 1)],
+        ),
+        (
+            datetimerangeset([datetimerange(datetime(2000, 1, 1, 12))]),
+            [datetime(2000, 1, 1), datetime(2000, 1, 1, 12), datetime(2001, 1, 1)],
+        ),
+        (strrangeset([strrange("b", "d")]), ["a", "b", "c", "d"]),
+        (
+            timedeltarangeset([timedeltarange(timedelta(1), timedelta(2))]),
+            [timedelta(0), timedelta(1), timedelta(2)],
+        ),
+    ],
+)
+def test_contains_many(rset, values):
+    expected = [rset.contains(value) for value in values]
+
+    assert [bool(found) for found in rset.contains_many(values)] == expected
+    assert [bool(found) for found in rset.contains_many(iter(values))] == expected
+
+
+@pytest.mark.parametrize(
+    "rset_type, lower, upper, lower_inc, upper_inc",
+    [
+        (intrangeset, [], [], None, None),
+        (intrangeset, [10, 1, 3, None], [15, 5, 8, -5], None, None),
+        (intrangeset, [1, 5, 6], [5, 5, 6], False, True),
+        (floatrangeset, [1.0, 2.0, None], [2.0, 3.0, 0.0], [True, False, False], None),
+        (floatrangeset, [1.0, 2.0, 3.0], [2.0, 3.0, None], False, [True, False, False]),
+        (
+            daterangeset,
+            [date(2000, 1, 1), date(2000, 1, 10)],
+            [date(2000, 1, 10), None],
+            None,
+            None,
+        ),
+        (
+            datetimerangeset,
+            [datetime(2000, 1, 1), None],
+            [datetime(2000, 1, 2), datetime(1999, 1, 1)],
+            None,
+            None,
+        ),
+        (strrangeset, ["a", "c"], ["c", "d"], None, None),
+        (
+            timedeltarangeset,
+            [timedelta(1), timedelta(3)],
+            [timedelta(2), timedelta(4)],
+            None,
+            True,
+        ),
+    ],
+)
+def test_from_arrays(rset_type, lower, upper, lower_inc, upper_inc):
+    def flags(flag):
+        if isinstance(flag, list):
+            return flag
+        return [flag] * len(lower)
+
+    expected = rset_type(
+        [
+            rset_type.type(*args)
+            for args in zip(lower, upper, flags(lower_inc), flags(upper_inc))
+        ]
+    )
+    rset = rset_type.from_arrays(lower, upper, lower_inc, upper_inc)
+
+    assert rset == expected
+    assert [r._range for r in rset] == [r._range for r in expected]
+
+
+def test_from_arrays_frozen():
+    rset = frozendaterangeset.from_arrays([date(2000, 1, 1)], [date(2000, 1, 2)])
+
+    assert isinstance(rset._list, tuple)
+    assert rset == daterangeset([daterange(date(2000, 1, 1), date(2000, 1, 2))])
+
+
+@pytest.mark.parametrize(
+    "lower, upper, lower_inc, upper_inc, exc_type",
+    [
+        ([1, 2], [3], None, None, ValueError),
+        ([5], [1], None, None, ValueError),
+        ([None], [1], True, None, ValueError),
+        ([1], [None], None, True, ValueError),
+        ([1.0], [2.0], None, None, TypeError),
+        (["1"], ["2"], None, None, TypeError),
+    ],
+)
+def test_from_arrays_invalid(lower, upper, lower_inc, upper_inc, exc_type):
+    with pytest.raises(exc_type):
+        intrangeset.from_arrays(lower, upper, lower_inc, upper_inc)
+
+
+def test_from_arrays_without_numpy(monkeypatch):
+    monkeypatch.setattr("spans.settypes.np", None)
+
+    rset = intrangeset.from_arrays([10, 1, 3], [15, 5, 8], upper_inc=True)
+    assert rset == intrangeset([intrange(1, 9), intrange(10, 16)])
+
+
+@pytest.mark.parametrize(
+    "rset_type, lower, upper",
+    [
+        # Bounds that can't be stored in NumPy arrays
+        (
+            datetimerangeset,
+            [datetime(2000, 1, 1, 3, tzinfo=timezone.utc), None],
+            [datetime(2000, 1, 1, 5, tzinfo=timezone.utc)] * 2,
+        ),
+        (intrangeset, [0, 2**70], [2**64, 2**71]),
+    ],
+)
+def test_from_arrays_fallback(monkeypatch, rset_type, lower, upper):
+    rset = rset_type.from_arrays(iter(lower), iter(upper))
+    assert rset == rset_type(map(rset_type.type, lower, upper))
+
+    monkeypatch.setattr("spans.settypes.np", None)
+    assert rset_type.from_arrays(lower, upper) == rset
+
+
+@pytest.mark.parametrize(
+    "rset_type, lower, upper, lower_inc, upper_inc",
+    [
+        # None means the default inclusiveness of the range constructor
+        (intrangeset, [1, 10], [3, 14], [None, True], [False, None]),
+        (intrangeset, [1, 10], [3, 14], [False, None], True),
+        # Bounds without a next value
+        (intrangeset, [2**63 - 2], [2**63 - 1], None, True),
+        (intrangeset, [2**63 - 1], [2**63 - 1], False, True),
+    ],
+)
+def test_from_arrays_same_as_python(
+    monkeypatch, rset_type, lower, upper, lower_inc, upper_inc
+):
+    rset = rset_type.from_arrays(lower, upper, lower_inc, upper_inc)
+
+    monkeypatch.setattr("spans.settypes.np", None)
+    expected = rset_type.from_arrays(lower, upper, lower_inc, upper_inc)
+    assert [r._range for r in rset] == [r._range for r in expected]
+
+
+def test_from_arrays_overflow():
+    with pytest.raises(OverflowError):
+        daterangeset.from_arrays(
+            [date(9999, 12, 30)], [date(9999, 12, 31)], upper_inc=True
+        )
+
+
+def test_contains_many_type_check():
+    with pytest.raises(TypeError):
+        intrangeset([intrange(1, 5)]).contains_many([1, 2.0])
+
+
+@pytest.mark.parametrize(
+    "rset, values",
+    [
+        # Ranges that can't be stored in NumPy arrays
+        (
+            datetimerangeset(
+                [
+                    datetimerange(
+                        datetime(2000, 1, 1, 2, tzinfo=timezone.utc),
+                        datetime(2000, 1, 1, 4, tzinfo=timezone.utc),
+                    )
+                ]
+            ),
+            [
+                datetime(2000, 1, 1, 1, tzinfo=timezone.utc),
+                datetime(2000, 1, 1, 3, tzinfo=timezone.utc),
+                datetime(2000, 1, 1, 4, tzinfo=timezone.utc),
+            ],
+        ),
+        (intrangeset([intrange(0, 2**70)]), [-1, 5, 2**69, 2**70]),
+        (frozenintrangeset([intrange(0, 2**70)]), [-1, 5, 2**69, 2**70]),
+        # Values that can't be stored in NumPy arrays
+        (intrangeset([intrange(0, 10), intrange(20)]), [5, 2**70, -(2**70)]),
+    ],
+)
+def test_contains_many_fallback(rset, values):
+    expected = [rset.contains(value) for value in values]
+
+    assert [bool(found) for found in rset.contains_many(values)] == expected
+    assert [bool(found) for found in rset.contains_many(iter(values))] == expected
+
+
+def test_contains_many_without_numpy(monkeypatch):
+    monkeypatch.setattr("spans.settypes.np", None)
+
+    rset = intrangeset([intrange(1, 5)])
+    assert rset.contains_many([0, 1, 5]) == [False, True, False]
+
+
 @pytest.mark.parametrize(
     "rset",
     [
@@ -100,6 +368,24 @@ def test_add():
         rset.add(floatrange(1.0))
 
 
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (intrange(7, 8), [intrange(1, 5), intrange(7, 8), intrange(10, 15)]),
+        (intrange(5, 10), [intrange(1, 15)]),
+        (intrange(3, 12), [intrange(1, 15)]),
+        (intrange(upper=1), [intrange(upper=5), intrange(10, 15)]),
+        (intrange(20), [intrange(1, 5), intrange(10, 15), intrange(20)]),
+        (intrange.empty(), [intrange(1, 5), intrange(10, 15)]),
+    ],
+)
+def test_add_merge(value, expected):
+    rset = intrangeset([intrange(1, 5), intrange(10, 15)])
+    rset.add(value)
+
+    assert list(rset) == expected
+
+
 def test_remove():
     rset = intrangeset([intrange(upper=1), intrange(5)])
     rset.remove(intrange(10, 15))
@@ -132,6 +418,31 @@ def test_invert():
     assert rset == ~~rset
 
 
+@pytest.mark.parametrize(
+    "ranges, inverted",
+    [
+        ([], [intrange()]),
+        ([intrange()], []),
+        ([intrange(upper=1), intrange(5)], [intrange(1, 5)]),
+        ([intrange(upper=1)], [intrange(1)]),
+        ([intrange(1)], [intrange(upper=1)]),
+    ],
+)
+def test_invert_unbounded(ranges, inverted):
+    assert list(~intrangeset(ranges)) == inverted
+
+
+def test_invert_continuous():
+    rset = floatrangeset([floatrange(1.0, 5.0), floatrange(5.0, 10.0, lower_inc=False)])
+
+    assert list(~rset) == [
+        floatrange(upper=1.0),
+        floatrange(5.0, 5.0, upper_inc=True),
+        floatrange(10.0),
+    ]
+    assert ~~rset == rset
+
+
 def test_union():
     a = intrangeset([intrange(1, 5), intrange(20, 30)])
     b = intrangeset([intrange(5, 10), intrange(20, 100)])
@@ -146,6 +457,29 @@ def test_union():
         intrangeset([]) | intrange()
 
 
+@pytest.mark.parametrize(
+    "a, b, union",
+    [
+        ([], [], []),
+        ([intrange(1, 5)], [], [intrange(1, 5)]),
+        ([], [intrange(1, 5)], [intrange(1, 5)]),
+        (
+            [intrange(1, 3), intrange(5, 7), intrange(9, 11)],
+            [intrange(3, 5), intrange(20, 25)],
+            [intrange(1, 7), intrange(9, 11), intrange(20, 25)],
+        ),
+        (
+            [intrange(upper=0), intrange(10, 15)],
+            [intrange(-5, 12), intrange(30)],
+            [intrange(upper=15), intrange(30)],
+        ),
+    ],
+)
+def test_union_merge(a, b, union):
+    assert list(intrangeset(a).union(intrangeset(b))) == union
+    assert list(intrangeset(b).union(intrangeset(a))) == union
+
+
 def test_difference():
     a = intrangeset([intrange(1, 5), intrange(20, 30)])
     b = intrangeset([intrange(5, 10), intrange(20, 100)])
@@ -160,6 +494,38 @@ def test_difference():
         intrangeset([]) - intrange()
 
 
+@pytest.mark.parametrize(
+    "a, b, difference",
+    [
+        ([], [intrange(1, 5)], []),
+        ([intrange(1, 5)], [], [intrange(1, 5)]),
+        (
+            [intrange(upper=10), intrange(20, 30)],
+            [intrange(1, 2), intrange(4, 6), intrange(8, 22), intrange(25, 26)],
+            [
+                intrange(upper=1),
+                intrange(2, 4),
+                intrange(6, 8),
+                intrange(22, 25),
+                intrange(26, 30),
+            ],
+        ),
+        ([intrange(1, 5), intrange(10, 15)], [intrange(upper=20)], []),
+    ],
+)
+def test_difference_sweep(a, b, difference):
+    assert list(intrangeset(a).difference(intrangeset(b))) == difference
+
+
+def test_remove_multiple():
+    rset = intrangeset([intrange(1, 5), intrange(10, 15), intrange(20, 25)])
+    rset.remove(intrange(3, 22))
+    assert list(rset) == [intrange(1, 3), intrange(22, 25)]
+
+    rset.remove(intrange(2, 3))
+    assert list(rset) == [intrange(1, 2), intrange(22, 25)]
+
+
 def test_intersection():
     a = intrangeset([intrange(1, 5), intrange(20, 30)])
     b = intrangeset([intrange(5, 10), intrange(20, 100)])
@@ -177,11 +543,255 @@ def test_intersection():
         intrangeset([]) & intrange()
 
 
+@pytest.mark.parametrize(
+    "a, b, intersection",
+    [
+        ([], [intrange(1, 5)], []),
+        (
+            [intrange(1, 10), intrange(20, 30)],
+            [intrange(upper=2), intrange(4, 6), intrange(8, 22), intrange(25)],
+            [
+                intrange(1, 2),
+                intrange(4, 6),
+                intrange(8, 10),
+                intrange(20, 22),
+                intrange(25, 30),
+            ],
+        ),
+        (
+            [intrange(1, 5), intrange(10, 15)],
+            [intrange(5, 10), intrange(15, 20)],
+            [],
+        ),
+    ],
+)
+def test_intersection_sweep(a, b, intersection):
+    assert list(intrangeset(a).intersection(intrangeset(b))) == intersection
+    assert list(intrangeset(b).intersection(intrangeset(a))) == intersection
+
+
+def test_symmetric_difference():
+    a = intrangeset([intrange(1, 5), intrange(20, 30)])
+    b = intrangeset([intrange(5, 10), intrange(25, 100)])
+    symmetric_difference = [intrange(1, 10), intrange(20, 25), intrange(30, 100)]
+
+    assert list(a.symmetric_difference(b)) == symmetric_difference
+    assert list(a ^ b) == symmetric_difference
+    assert list(b ^ a) == symmetric_difference
+
+    with pytest.raises(TypeError):
+        intrangeset([]).symmetric_difference(intrange())
+    with pytest.raises(TypeError):
+        intrangeset([]) ^ intrange()
+
+
+@pytest.mark.parametrize(
+    "method, op",
+    [
+        ("update", "__ior__"),
+        ("intersection_update", "__iand__"),
+        ("difference_update", "__isub__"),
+        ("symmetric_difference_update", "__ixor__"),
+    ],
+)
+def test_in_place_operations(method, op):
+    a = intrangeset([intrange(1, 5), intrange(20, 30)])
+    b = intrangeset([intrange(5, 10), intrange(25, 100)])
+    expected = {
+        "update": a | b,
+        "intersection_update": a & b,
+        "difference_update": a - b,
+        "symmetric_difference_update": a ^ b,
+    }[method]
+
+    rset = a.copy()
+    assert getattr(rset, method)(b) is None
+    assert rset == expected
+
+    rset = a.copy()
+    assert getattr(rset, op)(b) is rset
+    assert rset == expected
+
+    with pytest.raises(TypeError):
+        getattr(rset, method)(intrange())
+    assert getattr(rset, op)(intrange()) is NotImplemented
+
+
+def test_in_place_operators():
+    rset = intrangeset([intrange(1, 5)])
+    original = rset
+
+    rset |= intrangeset([intrange(5, 10)])
+    rset -= intrangeset([intrange(2, 3)])
+    rset &= intrangeset([intrange(upper=8)])
+    rset ^= intrangeset([intrange(6, 12)])
+
+    assert rset is original
+    assert rset == intrangeset([intrange(1, 2), intrange(3, 6), intrange(8, 12)])
+
+    with pytest.raises(TypeError):
+        rset |= intrange(1, 5)
+
+
 def test_values():
     values = intrangeset([intrange(1, 5), intrange(10, 15)]).values()
     assert list(values) == list(range(1, 5)) + list(range(10, 15))
 
 
+def test_daterangeset_values():
+    days = daterangeset(
+        [
+            daterange(date(2000, 1, 30), date(2000, 2, 2)),
+            daterange(date(2000, 3, 1), date(2000, 3, 2)),
+        ]
+    )
+
+    assert list(days.values()) == [
+        date(2000, 1, 30),
+        date(2000, 1, 31),
+        date(2000, 2, 1),
+        date(2000, 3, 1),
+    ]
+    assert days.day_count() == 4
+
+
+def test_period_ranges():
+    jan = PeriodRange.from_date(date(2000, 1, 1), period="month")
+    feb = jan.next_period()
+
+    rset = daterangeset([jan, feb])
+    assert repr(rset) == (
+        "daterangeset([daterange(datetime.date(2000, 1, 1), "
+        "datetime.date(2000, 3, 1))])"
+    )
+    assert type(rset.span()) is daterange
+    assert rset.span() == daterange(date(2000, 1, 1), date(2000, 3, 1))
+
+    rset = daterangeset([jan, feb]).difference(
+        daterangeset([daterange(date(2000, 1, 10), date(2000, 2, 10))])
+    )
+    assert [type(r) for r in rset] == [daterange, daterange]
+    assert rset == daterangeset(
+        [
+            daterange(date(2000, 1, 1), date(2000, 1, 10)),
+            daterange(date(2000, 2, 10), date(2000, 3, 1)),
+        ]
+    )
+
+    rset = daterangeset([jan])
+    rset.remove(daterange(date(2000, 1, 1), date(2000, 1, 5)))
+    assert [type(r) for r in rset] == [daterange]
+    assert rset == daterangeset([daterange(date(2000, 1, 5), date(2000, 2, 1))])
+
+
+def test_day_count():
+    assert daterangeset([]).day_count() == 0
+    year = daterange(date(2000, 1, 1), date(2001, 1, 1))
+    assert frozendaterangeset([year]).day_count() == 366
+
+    with pytest.raises(ValueError):
+        daterangeset([daterange(date(2000, 1, 1))]).day_count()
+
+
+@pytest.mark.parametrize(
+    "rset, measure",
+    [
+        (intrangeset([]), 0),
+        (intrangeset([intrange(1, 5), intrange(10, 15, upper_inc=True)]), 10),
+        (floatrangeset([]), 0.0),
+        (floatrangeset([floatrange(0.5, 1.0), floatrange(2.0, 4.25)]), 2.75),
+        (daterangeset([]), timedelta(0)),
+        (
+            daterangeset([daterange(date(2000, 1, 1), date(2000, 1, 31))]),
+            timedelta(30),
+        ),
+        (
+            datetimerangeset(
+                [
+                    datetimerange(datetime(2000, 1, 1), datetime(2000, 1, 1, 12)),
+                    datetimerange(datetime(2000, 1, 2), datetime(2000, 1, 2, 6)),
+                ]
+            ),
+            timedelta(hours=18),
+        ),
+        (
+            timedeltarangeset([timedeltarange(timedelta(1), timedelta(3))]),
+            timedelta(2),
+        ),
+    ],
+)
+def test_measure(rset, measure):
+    assert rset.measure() == measure
+    assert type(rset.measure()) is type(measure)
+
+
+@pytest.mark.parametrize(
+    "rset",
+    [
+        intrangeset([intrange(1)]),
+        intrangeset([intrange(upper=1), intrange(5, 10)]),
+        floatrangeset([floatrange()]),
+    ],
+)
+def test_measure_unbounded(rset):
+    with pytest.raises(ValueError):
+        rset.measure()
+
+
+def test_measure_unsupported():
+    assert not hasattr(strrangeset([]), "measure")
+
+
+def test_measure_cache():
+    rset = intrangeset([intrange(1, 5)])
+    assert rset.measure() == 4
+
+    rset.add(intrange(10, 15))
+    assert rset.measure() == 9
+    rset.remove(intrange(1, 3))
+    assert rset.measure() == 7
+    rset |= intrangeset([intrange(20, 22)])
+    assert rset.measure() == 9
+    rset &= intrangeset([intrange(0, 21)])
+    assert rset.measure() == 8
+    rset -= intrangeset([intrange(3, 4)])
+    assert rset.measure() == 7
+    rset ^= intrangeset([intrange(3, 6)])
+    assert rset.measure() == 8
+
+    loaded = pickle.loads(pickle.dumps(rset))
+    loaded.add(intrange(30, 40))
+    assert loaded.measure() == 18
+
+
+@pytest.mark.parametrize(
+    "rset",
+    [
+        frozenintrangeset([intrange(-(2**63), 2**63 - 1)]),
+        frozenintrangeset([intrange(1, 5), intrange(10, 15)]),
+        frozenfloatrangeset([floatrange(0.1 * i, 0.1 * i + 0.05) for i in range(100)]),
+        frozendaterangeset([daterange(date(2000, 1, 1), date(2000, 3, 1))]),
+        frozendatetimerangeset(
+            [datetimerange(datetime(2000, 1, 1), datetime(2000, 1, 1, 0, 0, 1, 5))]
+        ),
+    ],
+)
+def test_measure_columns(rset):
+    # Frozen sets whose columns are available sum them instead of the ranges
+    pytest.importorskip("numpy")
+    expected = type(rset)(rset).measure()
+
+    rset.contains_many([])
+    assert rset._cached_range_array() is not None
+    assert rset.measure() == expected
+    assert type(rset.measure()) is type(expected)
+
+
+def test_values_unbounded():
+    values = intrangeset([intrange(1, 5), intrange(10)]).values()
+    assert list(itertools.islice(values, 7)) == [1, 2, 3, 4, 10, 11, 12]
+
+
 @pytest.mark.parametrize(
     "span, repr_str",
     [
@@ -227,6 +837,17 @@ def test_greater_than():
     assert intrangeset([range_a, range_b]) >= intrangeset([range_a])
 
 
+@pytest.mark.parametrize("cls", [frozenintrangeset, compactintrangeset])
+def test_compare_mixed_storage(cls):
+    range_a = intrange(1, 5)
+    range_b = intrange(10, 15)
+
+    assert cls([range_a, range_b]) == intrangeset([range_a, range_b])
+    assert intrangeset([range_a, range_b]) != cls([range_a])
+    assert cls([range_a, range_b]) < intrangeset([range_b])
+    assert intrangeset([range_a, range_b]) >= cls([range_a])
+
+
 def test_bug3_intersection():
     """
     `Bug #3 <https://github.com/runfalk/spans/issues/3>`_
@@ -244,6 +865,17 @@ def test_bug3_intersection():
     assert rangeset_a.intersection(rangeset_b, rangeset_c) == rangeset_empty
 
 
+def test_multiple_sets():
+    a = intrangeset([intrange(1, 10), intrange(20, 30)])
+    b = intrangeset([intrange(upper=5), intrange(8, 25)])
+    c = intrangeset([intrange(2, 6), intrange(22)])
+
+    assert a.union(b, c) == intrangeset([intrange()])
+    assert a.intersection(b, c) == intrangeset([intrange(2, 5), intrange(22, 25)])
+    assert a.difference(b, c) == intrangeset([intrange(6, 8)])
+    assert a.intersection(b, c, intrangeset([])) == intrangeset([])
+
+
 def test_bug4_empty_set_iteration():
     """
     `Bug #4 <https://github.com/runfalk/spans/issues/4>`_
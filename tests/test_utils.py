@@ -19,6 +19,14 @@ def test_date_from_iso_week(args, day):
     assert date_from_iso_week(*args) == day
 
 
+@pytest.mark.parametrize("year", [1999, 2000, 2004, 2009, 2010, 2015, 2020])
+@pytest.mark.parametrize("day_of_week", [1, 4, 7])
+def test_date_from_iso_week_round_trip(year, day_of_week):
+    for week in range(1, date(year, 12, 28).isocalendar()[1] + 1):
+        day = date_from_iso_week(year, week, day_of_week=day_of_week)
+        assert tuple(day.isocalendar()) == (year, week, day_of_week)
+
+
 @pytest.mark.parametrize("day", [0, 8])
 def test_date_from_iso_week_invalid_day_of_week(day):
     with pytest.raises(ValueError):
@@ -37,3 +45,9 @@ def test_find_slots_multiple():
         __slots__ = ("a", "b")
 
     assert find_slots(Slots) == {"a", "b"}
+
+
+@pytest.mark.parametrize("week", [-1, 54])
+def test_date_from_iso_week_invalid_week(week):
+    with pytest.raises(ValueError):
+        date_from_iso_week(2000, week)